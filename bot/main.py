@@ -23,8 +23,11 @@ from threading import current_thread
 
 from bot.utils.task_manager import TaskManager
 from bot.utils.teams_organizer import TeamsOrganizer
+from bot.utils.index_refresher import IndexRefresher
 
-from bot.services.bot_backend import only_stats_main
+from bot.services.bot_backend import only_stats_main, update_follow_message, resume_follows, get_batch_fixtures_statistics
+from bot.services.match_engine import MatchEngine
+from bot.services.discord_dispatcher import DiscordDispatcher
 
 from configs.config import (
     footer_icon_url, 
@@ -38,6 +41,11 @@ from configs.config import (
 )
 
 from common_utils.time_logging import configure_logging
+from common_utils.api_client import api_client
+from common_utils.follow_journal import FollowJournal
+from common_utils.snapshot_log import snapshot_log
+from common_utils.executor import executor
+from common_utils.asset_cache import asset_cache
 
 intents = discord.Intents.default()
 bot = commands.Bot(intents=intents)
@@ -45,12 +53,33 @@ bot = commands.Bot(intents=intents)
 # Create a logger for the bot
 bot_logger = configure_logging("bot_main", "system")
 
-#Teams Organizer
-teams_organizer = TeamsOrganizer()
+#Teams Organizer, loaded in a worker thread so the bot connects and answers /ping meanwhile
+teams_organizer_ready = executor.submit_io(TeamsOrganizer)
+
+#Index Refresher, keeps kickoffs and teams current without a restart
+index_refresher = IndexRefresher(api_client)
 
 #Task Manager
 task_manager = TaskManager()
+
+#Discord Dispatcher, delivers message edits and announcements in the background
+dispatcher = DiscordDispatcher()
+
+#Follow Journal, keeps the running follows across restarts
+follow_journal = FollowJournal()
+
+#Match Engine, polls and updates every followed fixture from one scheduler
+match_engine = MatchEngine(get_batch_fixtures_statistics, update_follow_message, dispatcher, follow_journal)
+follows_resumed = False
   
+async def get_teams_organizer():
+    """
+    Waits until the team index is loaded, commands that look up teams start with it.
+
+    Returns:
+    - TeamsOrganizer: The loaded index
+    """
+    return await asyncio.wrap_future(teams_organizer_ready)
   
 #Ping command
 @bot.slash_command(
@@ -82,10 +111,9 @@ async def ping(ctx):
 
 # Autocomplete function
 async def team_autocomplete(ctx: discord.AutocompleteContext):
-    # Filter teams based on the user input
-    return [
-        team for team in teams_organizer.football_teams if team.lower().startswith(ctx.value.lower())
-    ]
+    # Up to 25 teams matching the user input, accents and case ignored
+    teams_organizer = await get_teams_organizer()
+    return teams_organizer.team_search.search(ctx.value)
 
 #Next game command
 @bot.slash_command(
@@ -116,15 +144,17 @@ async def team_schedule(
     if ctx.guild is None:
         return
 
+    teams_organizer = await get_teams_organizer()
+
     # Verify if the selected team is in the list of football teams
-    if team_name in teams_organizer.football_teams:
+    if teams_organizer.find_team_id(team_name):
         # Respond with the selected team if it is in the list
 
         team_league = teams_organizer.find_team_id(team_name)
         fixture_id, fixture_date = teams_organizer.new_find_next_fixture(team_league)
         # Assuming fixture_id returns the (id, date)
 
-        home_team, away_team = get_team_names_from_fixture(
+        home_team, away_team = await get_team_names_from_fixture(
             fixture_id
         ) 
         
@@ -178,7 +208,8 @@ async def team_following(
         )
         return
 
-    if team_name not in teams_organizer.football_teams:
+    teams_organizer = await get_teams_organizer()
+    if not teams_organizer.find_team_id(team_name):
         await ctx.respond("Invalid team selected. Please try again.")
         return
 
@@ -192,7 +223,7 @@ async def team_following(
         await ctx.respond(f"❌ No upcoming matches found for **{team_name}**.")
         return
 
-    home_team, away_team = get_team_names_from_fixture(fixture_id)
+    home_team, away_team = await get_team_names_from_fixture(fixture_id)
 
     user_id = ctx.author.id
 
@@ -200,7 +231,7 @@ async def team_following(
 
     if task_manager.new_get_task_count(user_id) < MAX_SIMULTANEOUS_GAMES:
         # Move task addition after successful message send
-        thread_opening_embed, team_logos = get_thread_embed(fixture_id, 1)
+        thread_opening_embed, team_logos = await get_thread_embed(fixture_id, 1)
 
         await ctx.respond(
             f"✅ **{team_name}** chosen successfully and the task is being processed!"
@@ -216,20 +247,17 @@ async def team_following(
             # Only add the task if message was sent successfully
             task_manager.new_add_task(user_id, task_manager_string)
             
-            previous_attachments = initial_message.attachments
-
-            # Start the main function as a background task
-            task = asyncio.create_task(
-                only_stats_main(
-                    bot, 
-                    initial_message, 
-                    fixture_id, 
-                    user_id, 
-                    task_manager, 
-                    previous_attachments, 
-                    int(events_id), 
-                    channel_id
-                )
+            # The match engine keeps the message updated from now on
+            await only_stats_main(
+                bot, 
+                initial_message, 
+                fixture_id, 
+                user_id, 
+                task_manager, 
+                int(events_id), 
+                channel_id,
+                fixture_date,
+                match_engine
             )
         except discord.Forbidden:
             await ctx.respond(
@@ -301,8 +329,21 @@ async def on_ready():
     await bot.change_presence(status=discord.Status.online, activity=game)
     bot_logger.info(f"{bot.user} is ready and online!")
 
+    # on_ready runs again after reconnects, the follows only need resuming once
+    global follows_resumed
+    if not follows_resumed:
+        follows_resumed = True
+        await resume_follows(bot, task_manager, match_engine, follow_journal)
+        index_refresher.start(await get_teams_organizer())
+
 async def close_bot():
+    index_refresher.stop()
     await bot.close()
+    follow_journal.flush()
+    snapshot_log.close()
+    executor.shutdown()
+    await asset_cache.close()
+    await api_client.close()
 
 async def start_bot():
     try:
@@ -310,6 +351,13 @@ async def start_bot():
     except Exception as e:
         bot_logger.error(f"Bot encountered an error: {e}")
         raise
+    finally:
+        index_refresher.stop()
+        follow_journal.flush()
+        snapshot_log.close()
+        executor.shutdown()
+        await asset_cache.close()
+        await api_client.close()
 
 if __name__ == "__main__":
     # asyncio.run(start_bot())
@@ -1,81 +1,85 @@
 import sys
-import requests
-import json
-import pandas as pd
-import emoji
 from datetime import datetime
-import asyncio
 import discord
 import logging
 
 from views.button import CombinedView
-from common_utils.fixture_utils import get_team_names_from_fixture
+from bot.services.match_snapshot import MatchSnapshot, SHOTS_ON_GOAL, CORNER_KICKS, BALL_POSSESSION
+from bot.services.match_engine import MatchFollow, PRE_GAME, LIVE
+from bot.services.snapshot_diff import diff_snapshots, get_new_events, event_key, EVENT_REMOVED, EVENT_AMENDED
+from common_utils.fixture_utils import get_fixtures_batch
+from common_utils.fixture_cache import fixture_cache
+from common_utils.follow_journal import load_event_cursor
+from common_utils.snapshot_log import snapshot_log
+from common_utils.executor import executor
+from common_utils.asset_cache import asset_cache, BANNER_ATTACHMENT
+from common_utils.banner_registry import banner_registry
 from common_utils.time_logging import configure_logging, calculate_time_remaining
 
 from configs.config import (
-    base_url,
-    headers,
     footer_icon_url,
     thumbnail_logo, 
     embed_color,
     footer_text,
     website_name,
     website_url,
-    website_field_name,
-    LIVE_JSON_PATH,
-    BANNERS_PATH,
-    LOOP_WAIT_TIME
+    website_field_name
 )
-async def get_fixtures_statistics(fixture_id):
+
+async def get_batch_fixtures_statistics(fixture_ids):
     """
-    Retrieves fixture statistics from the API for a specific match.
+    Retrieves fixture statistics for several matches with as few API calls as possible.
     
     Parameters:
-    - fixture_id (int): The unique identifier for the fixture
+    - fixture_ids (list): Unique identifiers of the fixtures
+    
+    Returns:
+    - dict: {fixture_id: list as returned by build_fixture_statistics}
+      Fixtures missing from the API response are left out.
+    """
+
+    fixtures = await get_fixtures_batch(fixture_ids)
+
+    return {
+        fixture_id: build_fixture_statistics(specific_fixture)
+        for fixture_id, specific_fixture in fixtures.items()
+    }
+
+def build_fixture_statistics(specific_fixture):
+    """
+    Extracts the match statistics from a fixture API response.
+    
+    Parameters:
+    - specific_fixture (dict): Raw fixture API response holding a single fixture
     
     Returns:
     - list: Contains:
         [0] int: 0 if game not started, 1 if in progress 
-        [1] dict: Match statistics and data
+        [1] MatchSnapshot: Match statistics and data
         [2] file: Discord file object or 0
         [3] embed: Discord embed object or file
         [4] dict: Raw fixture API response
     """
 
-    params = {"id": fixture_id, 'timezone' : "Europe/London"}
-    fixtures_url = base_url + "/fixtures"
-    response = requests.get(fixtures_url, headers=headers, params=params)
-
-    specific_fixture = response.json()
-
     for item in specific_fixture["response"]:
-        del item["lineups"]
-        del item["players"]
+        item.pop("lineups", None)
+        item.pop("players", None)
 
     home_team = str(specific_fixture["response"][0]["teams"]["home"]["name"])
     away_team = str(specific_fixture["response"][0]["teams"]["away"]["name"])
 
-    with open(
-        f"{LIVE_JSON_PATH}/{home_team}vs{away_team}.json",
-        "w",
-        encoding="utf-8",
-    ) as f:
-        json.dump(specific_fixture, f, ensure_ascii=False, indent=4)
-
-    data_dict = {}
+    # Kept as compressed deltas by a background writer, see common_utils.snapshot_log
+    snapshot_log.append(specific_fixture)
 
     time_elapsed = specific_fixture["response"][0]["fixture"]["status"]["elapsed"]
 
     file = 0
 
-    # Checking if the elapsed time is not None. If the game is yet to start it is None
-    if time_elapsed is not None:
-        time_elapsed = int(time_elapsed)
-    else:
-
-        home_team = str(specific_fixture["response"][0]["teams"]["home"]["name"])
-        away_team = str(specific_fixture["response"][0]["teams"]["away"]["name"])
+    # Filled in one pass, the values are 0 if the game didn't start yet
+    snapshot = MatchSnapshot.from_fixture(specific_fixture)
 
+    # Checking if the elapsed time is not None. If the game is yet to start it is None
+    if time_elapsed is None:
 
         date = str(specific_fixture["response"][0]["fixture"]["date"])
 
@@ -107,159 +111,40 @@ async def get_fixtures_statistics(fixture_id):
         # Set the footer of the embed
         embed.set_footer(text=footer_text, icon_url=footer_icon_url)  # •
         
-        """Also Return the embed containing the bets"""
-        # Copy of the data dict used in the call made to the function during the game. Here we can assume the values as 0 cause the game didnt start.
-        fake_data_dict = {
-            "Time Elapsed": 0,
-            "Game Status": "1H",  # used 1H to overpass the checks in the bets checker This way, the one of the half bets related will always be yellow
-            "Home Team": home_team,
-            "Away Team": away_team,
-            "First to Score": 0,
-            "Home Ball Possession" : 0,
-            "Away Ball Possession" : 0,
-            home_team + " Goals": 0,
-            away_team + " Goals": 0,
-            home_team + " Halftime Goals": 0,
-            away_team + " Halftime Goals": 0,
-            home_team + " Shots on Goal": 0,
-            away_team + " Shots on Goal": 0,
-            home_team + " Corner Kicks": 0,
-            away_team + " Corner Kicks": 0,
-        }
-        
-        return [0, fake_data_dict, file, embed, specific_fixture]
-
-    game_status = str(specific_fixture["response"][0]["fixture"]["status"]["short"])
-    home_team = str(specific_fixture["response"][0]["teams"]["home"]["name"])
-    away_team = str(specific_fixture["response"][0]["teams"]["away"]["name"])
-
-    home_goals = int(specific_fixture["response"][0]["goals"]["home"])
-    away_goals = int(specific_fixture["response"][0]["goals"]["away"])
-
-    home_halftime = int(specific_fixture["response"][0]["score"]["halftime"]["home"])
-    away_halftime = int(specific_fixture["response"][0]["score"]["halftime"]["away"])
-
-    home_team_stats = {}
-    away_team_stats = {}
-
-    # Loop through the response to extract statistics for both teams
-    for team_stats in specific_fixture["response"][0]["statistics"]:
-        team_name = team_stats["team"]["name"]
-        statistics = team_stats["statistics"]
-
-        # Initialize variables for each statistic type
-        for stat in statistics:
-            stat_type = stat["type"]
-            stat_value = stat["value"]
-
-            # Store statistics in the respective team"s dictionary
-            if team_name == home_team:
-                home_team_stats[stat_type] = stat_value
-            elif team_name == away_team:
-                away_team_stats[stat_type] = stat_value
-
-    # Loop through the response to extract events goals related
-
-    '''There are games that do not have events!!'''
-
-    if not specific_fixture["response"][0]["events"]:  # if list is empty. No events
-        first_scorer = "none"
-    else:  # if list is not empty. There is events
-        for event in specific_fixture["response"][0]["events"]:
-            if event["type"] == "Goal" and event["detail"] != "Missed Penalty":
-                # If the goal is valid
-                first_scorer = str(event["team"]["name"])
-                break
-            else:
-                first_scorer = "none"
-
-    # Now you can access the statistics for the home and away teams
-    home_shots_on_goal = int(home_team_stats.get("Shots on Goal", 0)) if home_team_stats.get("Shots on Goal") is not None else 0
-    away_shots_on_goal = int(away_team_stats.get("Shots on Goal", 0)) if away_team_stats.get("Shots on Goal") is not None else 0
-
-    home_corner_kicks = int(home_team_stats.get("Corner Kicks", 0)) if home_team_stats.get("Corner Kicks") is not None else 0
-    away_corner_kicks = int(away_team_stats.get("Corner Kicks", 0)) if away_team_stats.get("Corner Kicks") is not None else 0
-
-    temp_home_poss = (home_team_stats.get("Ball Possession", "0%")) 
-    temp_away_poss = (away_team_stats.get("Ball Possession", "0%")) 
-
-    home_ball_possession = int(temp_home_poss.strip('%')) if temp_home_poss is not None else 0
-    away_ball_possession = int(temp_away_poss.strip('%')) if temp_away_poss is not None else 0
-
-
-    data_dict = {
-        "Time Elapsed": time_elapsed,
-        "Game Status": game_status,
-        "Home Team": home_team,
-        "Away Team": away_team,
-        "First to Score": first_scorer,
-        "Home Ball Possession" : home_ball_possession,
-        "Away Ball Possession" : away_ball_possession,
-        home_team + " Goals": home_goals,
-        away_team + " Goals": away_goals,
-        home_team + " Halftime Goals": home_halftime,
-        away_team + " Halftime Goals": away_halftime,
-        home_team + " Shots on Goal": home_shots_on_goal,
-        away_team + " Shots on Goal": away_shots_on_goal,
-        home_team + " Corner Kicks": home_corner_kicks,
-        away_team + " Corner Kicks": away_corner_kicks,
-    }
+        return [0, snapshot, file, embed, specific_fixture]
 
+    return [1, snapshot, 0, file, specific_fixture]
 
-    return [1, data_dict, 0, file, specific_fixture]
-
-async def information_presenter(live_stats_dict, bot, previous_size, specific_fixture, task_manager, author_id, announcment_id, logger):
+async def information_presenter(snapshot, bot, new_events, specific_fixture, task_manager, author_id, announcment_id, logger, dispatcher):
     """
     Creates and updates Discord embeds with match information and events.
     
     Parameters:
-    - live_stats_dict (dict): Current match statistics
+    - snapshot (MatchSnapshot): Current match statistics
     - bot (discord.Client): Bot instance
-    - previous_size (int): Previous number of events
+    - new_events (list): Events added since the last snapshot
     - specific_fixture (dict): Raw fixture data
     - task_manager (TaskManager): Task management instance
     - author_id (int): Discord user ID who initiated
     - announcment_id (int): Channel ID for announcements
     - logger (logging.Logger): Logger instance
+    - dispatcher (DiscordDispatcher): Queue delivering the announcements
     
     Returns:
-    - tuple: (discord.Embed, int) Contains updated embed and new event count
+    - discord.Embed: Updated game status embed
     """
 
     # Game Status Section
-    home_team = live_stats_dict["Home Team"]
-    away_team = live_stats_dict["Away Team"]
+    home_team = snapshot.home_team
+    away_team = snapshot.away_team
 
     league_image = specific_fixture["response"][0]["league"]["logo"]
 
 
-    team_stats = {
-        home_team + " Goals": 0,
-        away_team + " Goals": 0,
-        home_team + " Halftime Goals": 0,
-        away_team + " Halftime Goals": 0,
-        home_team + " Shots on Goal": 0,
-        away_team + " Shots on Goal": 0,
-        home_team + " Corner Kicks": 0,
-        away_team + " Corner Kicks": 0,
-        "Home Ball Possession" : live_stats_dict["Home Ball Possession"],
-        "Away Ball Possession" : live_stats_dict["Away Ball Possession"]
-    }
-
-    for key, value in live_stats_dict.items():
-        if home_team in key or away_team in key:
-            team_stats[key] = value
             
 
-    events = specific_fixture["response"][0]["events"]
-
-    current_size = 0
-    
-    current_size = len(events) if events else previous_size
-            
-    if current_size > previous_size:
+    if new_events:
         # There are new events, process them.
-        new_events = events[previous_size:]  # Get only the new events.
         
         for event in new_events:
             # Check if the event type is 'Goal' or 'Var'
@@ -307,27 +192,27 @@ async def information_presenter(live_stats_dict, bot, previous_size, specific_fi
                 time_elapsed = event['time']['elapsed']
 
                 if event['time']['extra'] == None:
-                    value_embed=f"> **Time Elapsed:** {time_elapsed} minutes\n> **Game Status:** {live_stats_dict.get('Game Status')}\n> **Details:** {event['detail']}\n> **Player:** {player_name}"
+                    value_embed=f"> **Time Elapsed:** {time_elapsed} minutes\n> **Game Status:** {snapshot.status}\n> **Details:** {event['detail']}\n> **Player:** {player_name}"
                 else:
-                    value_embed=f"> **Time Elapsed:** {time_elapsed} minutes\n> **Extra:** {event['time']['extra']}\n> **Game Status:** {live_stats_dict.get('Game Status')}\n> **Details:** {event['detail']}\n> **Player:** {player_name}"
+                    value_embed=f"> **Time Elapsed:** {time_elapsed} minutes\n> **Extra:** {event['time']['extra']}\n> **Game Status:** {snapshot.status}\n> **Details:** {event['detail']}\n> **Player:** {player_name}"
 
                 
                 if event['type'] == "Card" and event['detail'] == "Red Card" and event['time']['extra'] == None:
-                    value_embed=f"> **Time Elapsed:** {time_elapsed} minutes\n> **Game Status:** {live_stats_dict.get('Game Status')}\n> **Details:** {event['comments']}\n> **Player:** {player_name}"
+                    value_embed=f"> **Time Elapsed:** {time_elapsed} minutes\n> **Game Status:** {snapshot.status}\n> **Details:** {event['comments']}\n> **Player:** {player_name}"
                 elif event['type'] == "Card" and event['detail'] == "Red Card" and event['time']['extra'] != None:
-                    value_embed=f"> **Time Elapsed:** {time_elapsed} minutes\n> **Extra:** {event['time']['extra']}\n> **Game Status:** {live_stats_dict.get('Game Status')}\n> **Details:** {event['comments']}\n> **Player:** {player_name}"
+                    value_embed=f"> **Time Elapsed:** {time_elapsed} minutes\n> **Extra:** {event['time']['extra']}\n> **Game Status:** {snapshot.status}\n> **Details:** {event['comments']}\n> **Player:** {player_name}"
 
 
                 if event['type'] == "Goal" and event['time']['extra'] == None:
-                    value_embed=f"> **Result:** {team_stats.get(f'{home_team} Goals')} - {team_stats.get(f'{away_team} Goals')}\n> **Time Elapsed:** {time_elapsed} minutes\n> **Game Status:** {live_stats_dict.get('Game Status')}\n> **Player:** {player_name}"
+                    value_embed=f"> **Result:** {snapshot.home_goals} - {snapshot.away_goals}\n> **Time Elapsed:** {time_elapsed} minutes\n> **Game Status:** {snapshot.status}\n> **Player:** {player_name}"
                 elif event['type'] == "Goal" and event['time']['extra'] != None:
-                    value_embed=f"> **Result:** {team_stats.get(f'{home_team} Goals')} - {team_stats.get(f'{away_team} Goals')}\n> **Time Elapsed:** {time_elapsed} minutes\n> **Extra:** {event['time']['extra']}\n> **Game Status:** {live_stats_dict.get('Game Status')}\n> **Player:** {player_name}"
+                    value_embed=f"> **Result:** {snapshot.home_goals} - {snapshot.away_goals}\n> **Time Elapsed:** {time_elapsed} minutes\n> **Extra:** {event['time']['extra']}\n> **Game Status:** {snapshot.status}\n> **Player:** {player_name}"
 
 
                 if event['type'] == "Var" and event['time']['extra'] == None:
-                    value_embed=f"> **Result:** {team_stats.get(f'{home_team} Goals')} - {team_stats.get(f'{away_team} Goals')}\n> **Time Elapsed:** {time_elapsed} minutes\n> **Game Status:** {live_stats_dict.get('Game Status')}\n> **Details:** {event['detail']}\n> **Player:** {player_name}"
+                    value_embed=f"> **Result:** {snapshot.home_goals} - {snapshot.away_goals}\n> **Time Elapsed:** {time_elapsed} minutes\n> **Game Status:** {snapshot.status}\n> **Details:** {event['detail']}\n> **Player:** {player_name}"
                 elif event['type'] == "Var" and event['time']['extra'] != None:
-                    value_embed=f"> **Result:** {team_stats.get(f'{home_team} Goals')} - {team_stats.get(f'{away_team} Goals')}\n> **Time Elapsed:** {time_elapsed} minutes\n> **Extra:** {event['time']['extra']}\n> **Game Status:** {live_stats_dict.get('Game Status')}\n> **Details:** {event['detail']}\n> **Player:** {player_name}"
+                    value_embed=f"> **Result:** {snapshot.home_goals} - {snapshot.away_goals}\n> **Time Elapsed:** {time_elapsed} minutes\n> **Extra:** {event['time']['extra']}\n> **Game Status:** {snapshot.status}\n> **Details:** {event['detail']}\n> **Player:** {player_name}"
 
                 '''Add de Penalty json part here'''
                 if event['comments'] == "Penalty Shootout":
@@ -335,7 +220,7 @@ async def information_presenter(live_stats_dict, bot, previous_size, specific_fi
                     home_penalty = 0 if specific_fixture["response"][0]["score"]["penalty"]["home"] is None else specific_fixture["response"][0]["score"]["penalty"]["home"]
                     away_penalty = 0 if specific_fixture["response"][0]["score"]["penalty"]["away"] is None else specific_fixture["response"][0]["score"]["penalty"]["away"]
 
-                    value_embed=f"> **Penalty:** {home_penalty} - {away_penalty}\n> **Time Elapsed:** {time_elapsed} minutes\n> **Game Status:** {live_stats_dict.get('Game Status')}\n> **Details:** {event['detail']}\n> **Player:** {player_name}"
+                    value_embed=f"> **Penalty:** {home_penalty} - {away_penalty}\n> **Time Elapsed:** {time_elapsed} minutes\n> **Game Status:** {snapshot.status}\n> **Details:** {event['detail']}\n> **Player:** {player_name}"
                 
                 # Add the game information
                 event_embed.add_field(
@@ -364,33 +249,29 @@ async def information_presenter(live_stats_dict, bot, previous_size, specific_fi
                     logger.warning(f"Channel {announcment_id} not found")
                     continue
 
-                try:
-                    await bet_hit_channel.send(content=None, embed=event_embed)
-                except discord.Forbidden:
-                    logger.warning(f"Missing permissions to send messages in channel {announcment_id}")
-                except discord.HTTPException as e:
-                    logger.error(f"Failed to send event message: {e}")
+                # Delivered in the background so polling never waits on Discord
+                dispatcher.queue_send(bet_hit_channel, event_embed)
 
     # Create the first embed
     embed1 = discord.Embed(
         title="⚽ Game Status",
-        description=f"**{home_team} vs {away_team}**\n> **Time Elapsed:** {live_stats_dict.get('Time Elapsed')} minutes\n> **Game Status:** {live_stats_dict.get('Game Status')}",
+        description=f"**{home_team} vs {away_team}**\n> **Time Elapsed:** {snapshot.elapsed} minutes\n> **Game Status:** {snapshot.status}",
         color=embed_color,
         timestamp=datetime.now(),
     )
     
     embed1.add_field(name="**Team Stats**",
                     value = (
-                        f"> **Result:** {team_stats.get(f'{home_team} Goals')} - "
-                        f"{team_stats.get(f'{away_team} Goals')} \n"
-                        f"> **Halftime Goals:** {team_stats.get(f'{home_team} Halftime Goals')} - "
-                        f"{team_stats.get(f'{away_team} Halftime Goals')} \n"
-                        f"> **Corner Kicks:** {team_stats.get(f'{home_team} Corner Kicks')} - "
-                        f"{team_stats.get(f'{away_team} Corner Kicks')} \n"
-                        f"> **Shots on Goal:** {team_stats.get(f'{home_team} Shots on Goal')} - "
-                        f"{team_stats.get(f'{away_team} Shots on Goal')} \n"
-                        f"> **Ball Possession:** {team_stats.get('Home Ball Possession')}% - "
-                        f"{team_stats.get('Away Ball Possession')}%"
+                        f"> **Result:** {snapshot.home_goals} - "
+                        f"{snapshot.away_goals} \n"
+                        f"> **Halftime Goals:** {snapshot.home_halftime} - "
+                        f"{snapshot.away_halftime} \n"
+                        f"> **Corner Kicks:** {snapshot.home_stats[CORNER_KICKS]} - "
+                        f"{snapshot.away_stats[CORNER_KICKS]} \n"
+                        f"> **Shots on Goal:** {snapshot.home_stats[SHOTS_ON_GOAL]} - "
+                        f"{snapshot.away_stats[SHOTS_ON_GOAL]} \n"
+                        f"> **Ball Possession:** {snapshot.home_stats[BALL_POSSESSION]}% - "
+                        f"{snapshot.away_stats[BALL_POSSESSION]}%"
                     ),
                     inline=False)
     
@@ -403,48 +284,30 @@ async def information_presenter(live_stats_dict, bot, previous_size, specific_fi
     embed1.set_thumbnail(url=league_image)
     embed1.set_footer(text=footer_text, icon_url=footer_icon_url)  # •
      
-    file = discord.File(
-        f"{BANNERS_PATH}/{home_team}vs{away_team}.png",
-        filename="image.png",
-    )
+    # The banner is already attached to the follower message
     # Set the image in the embed to reference the uploaded file by using `attachment://filename`
-    embed1.set_image(url="attachment://image.png")
+    embed1.set_image(url=f"attachment://{BANNER_ATTACHMENT}")
     
-    return embed1, current_size
+    return embed1
 
-async def game_status_func(bot, specific_fixture, live_stats_dict, announcment_id, game_moment, logger):
+async def game_status_func(bot, specific_fixture, snapshot, announcment_id, game_moment, logger, dispatcher):
     """
     Sends game status announcements to specified channel.
     
     Parameters:
     - bot (discord.Client): Bot instance
     - specific_fixture (dict): Raw fixture data
-    - live_stats_dict (dict): Current match statistics
+    - snapshot (MatchSnapshot): Current match statistics
     - announcment_id (int): Channel ID for announcements
     - game_moment (str): Current game state (e.g. "Game Started", "Halftime")
     - logger (logging.Logger): Logger instance
+    - dispatcher (DiscordDispatcher): Queue delivering the announcement
     """
 
     # Game Status Section
-    home_team = live_stats_dict["Home Team"]
-    away_team = live_stats_dict["Away Team"]
+    home_team = snapshot.home_team
+    away_team = snapshot.away_team
    
-    team_stats = {
-        home_team + " Goals": 0,
-        away_team + " Goals": 0,
-        home_team + " Halftime Goals": 0,
-        away_team + " Halftime Goals": 0,
-        home_team + " Shots on Goal": 0,
-        away_team + " Shots on Goal": 0,
-        home_team + " Corner Kicks": 0,
-        away_team + " Corner Kicks": 0,
-        "Home Ball Possession" : live_stats_dict["Home Ball Possession"],
-        "Away Ball Possession" : live_stats_dict["Away Ball Possession"]
-    }
-
-    for key, value in live_stats_dict.items():
-        if home_team in key or away_team in key:
-            team_stats[key] = value
    
     try:
         announcements_channel = bot.get_channel(announcment_id)
@@ -484,7 +347,7 @@ async def game_status_func(bot, specific_fixture, live_stats_dict, announcment_i
         # Add the game information
         game_status.add_field(
             name=f"**{home_team} vs {away_team}**\n",
-            value = f"> **Result:** {team_stats.get(f'{home_team} Goals')} - {team_stats.get(f'{away_team} Goals')}",
+            value = f"> **Result:** {snapshot.home_goals} - {snapshot.away_goals}",
             inline=False,
         )
         
@@ -496,25 +359,34 @@ async def game_status_func(bot, specific_fixture, live_stats_dict, announcment_i
             text=footer_text, icon_url=footer_icon_url 
         )
 
-        file = discord.File(
-            f"{BANNERS_PATH}/{home_team}vs{away_team}.png",
-            filename="image.png",
-        )
-        # Set the image in the embed to reference the uploaded file by using `attachment://filename`
-        game_status.set_image(url="attachment://image.png")
+        banner_path = asset_cache.get_banner_path(specific_fixture)
+        banner_url = banner_registry.get_url(banner_path)
+
+        if banner_url is not None:
+            # Uploaded before, the embed points at the CDN copy
+            game_status.set_image(url=banner_url)
+            dispatcher.queue_send(announcements_channel, game_status)
+        else:
+            banner_path = await asset_cache.get_banner(specific_fixture)
+            file = await executor.run_io(
+                discord.File,
+                str(banner_path),
+                filename=BANNER_ATTACHMENT,
+            )
+            # Set the image in the embed to reference the uploaded file by using `attachment://filename`
+            game_status.set_image(url=f"attachment://{BANNER_ATTACHMENT}")
 
-        await announcements_channel.send(content=None, embed=game_status, file=file)
+            dispatcher.queue_send(
+                announcements_channel, game_status, file,
+                on_sent=lambda message: banner_registry.record_message(banner_path, message)
+            )
         
-    except discord.Forbidden:
-        logger.warning(f"Missing permissions to send messages in channel {announcment_id}")
-    except discord.HTTPException as e:
-        logger.error(f"Failed to send game status message: {e}")
     except Exception as e:
         logger.error(f"Unexpected error sending game status: {e}")
 
-async def only_stats_main(bot, initial_message, fixture_id, author_id, task_manager, previous_attachments, announcment_id, channel_id):
+async def only_stats_main(bot, initial_message, fixture_id, author_id, task_manager, announcment_id, channel_id, fixture_date, match_engine):
     """
-    Main function to monitor and update match statistics.
+    Starts following a match, the match engine then keeps the message and announcements updated.
     
     Parameters:
     - bot (discord.Client): Bot instance
@@ -522,333 +394,167 @@ async def only_stats_main(bot, initial_message, fixture_id, author_id, task_mana
     - fixture_id (int): Match identifier
     - author_id (int): Discord user ID who initiated
     - task_manager (TaskManager): Task management instance
-    - previous_attachments (list): Previous message attachments
     - announcment_id (int): Channel ID for announcements
     - channel_id (int): Channel ID where command was used
+    - fixture_date (str): Kickoff time from the local fixture index, ISO 8601
+    - match_engine (MatchEngine): Scheduler updating every followed fixture
     """
 
     if announcment_id == 0:
         announcment_id = channel_id
-            
 
-    '''CHANGE THIS TO BE BASED ON THE HOME TEAM AND AWAY TEAM AND NOT THE XLSX FILE NAME'''
-    home_team, away_team = get_team_names_from_fixture(
-        fixture_id
-    ) 
+    # Already cached by the follow command, so this doesn't cost an API call
+    specific_fixture = await fixture_cache.get(fixture_id)
+
+    home_team = str(specific_fixture["response"][0]["teams"]["home"]["name"])
+    away_team = str(specific_fixture["response"][0]["teams"]["away"]["name"])
     
     logger_name = home_team + away_team
     
-    logger = configure_logging(logger_name, author_id)
+    # Opening the log file blocks, so it happens on a worker thread
+    logger = await executor.run_io(configure_logging, logger_name, author_id)
 
-    live_stats_dict = await get_fixtures_statistics(
-        fixture_id
+    task_manager_string = f"{home_team} vs {away_team}"
+
+    follow = MatchFollow(
+        bot, initial_message, fixture_id, author_id, announcment_id, task_manager, task_manager_string, logger,
+        kickoff=datetime.fromisoformat(fixture_date)
+    )
+    follow.buttons = CombinedView(follow, author_id, task_manager, {})
+    follow.buttons.update_stats(specific_fixture)
+
+    # The opening message carries the banner, later announcements reuse its URL
+    banner_registry.record_message(asset_cache.get_banner_path(specific_fixture), initial_message)
+
+    # The opening message already shows the kickoff time, it only needs the buttons until the game gets close
+    match_engine.dispatcher.queue_edit(
+        initial_message, initial_message.embeds[0], follow.buttons, on_failure=lambda error: follow.end(f"An error occurred: {error}. Exiting the function.")
     )
-    specific_fixture = live_stats_dict[4]
-     
-    data_dict = live_stats_dict[1]
-    
-    home_team = data_dict["Home Team"]
-    away_team = data_dict["Away Team"]
-    
-    all_stats_dict = {}
-   
-    task = asyncio.current_task()
-    all_buttons = CombinedView(task, author_id, task_manager, all_stats_dict)
-        
-    all_buttons.update_stats(specific_fixture)
+
+    match_engine.add_follow(follow)
 
     logger.info("Game monitoring started message sent.")
-    previous_size = 0
+
+async def resume_follows(bot, task_manager, match_engine, journal):
+    """
+    Restarts the follows recorded in the journal, editing their existing messages again.
     
-    task_manager_string = f"{home_team} vs {away_team}"
+    Every resumed fixture is due right away, so they are all checked in one batched fetch.
     
-    while True:
+    Parameters:
+    - bot (discord.Client): Bot instance
+    - task_manager (TaskManager): Task management instance
+    - match_engine (MatchEngine): Scheduler updating every followed fixture
+    - journal (FollowJournal): Journal of the follows running before the restart
+    """
 
-        live_stats_dict = await get_fixtures_statistics(fixture_id)  
+    resume_logger = await executor.run_io(configure_logging, "resume_follows", "system")
 
-        specific_fixture = live_stats_dict[4]
-        all_buttons.update_stats(specific_fixture)
-        
-        # Game Not started halt
+    follows = await executor.run_io(journal.load)
 
-        if 0 == live_stats_dict[0]:
+    for record in follows.values():
+        channel = bot.get_channel(record["channel_id"])
+        if channel is None:
+            try:
+                channel = await bot.fetch_channel(record["channel_id"])
+            except (discord.NotFound, discord.Forbidden) as e:
+                # The channel is gone or hidden from the bot, the follow can never be resumed
+                resume_logger.warning(f"Dropped the follow of message {record['message_id']}: {e}")
+                journal.record_dropped(record["message_id"])
+                continue
+            except discord.HTTPException as e:
+                # Kept in the journal, the next restart tries again
+                resume_logger.warning(f"Couldn't resume the follow of message {record['message_id']}: {e}")
+                continue
 
+        # A partial message can be edited without fetching it first
+        initial_message = channel.get_partial_message(record["message_id"])
 
-            embed_before_game = live_stats_dict[3]
-            
-            embed_before_game.set_image(url="attachment://image.png")  # Use the same attachment filename
-            file = live_stats_dict[2]
-
-            retry_count = 0
-            max_retries = 3
-                      
-            while retry_count < max_retries:
-                try:
-                    await initial_message.edit(
-                        content=None,
-                        embed=embed_before_game,
-                        view=all_buttons,
-                    )
-                    logger.debug("Initial message edited for game not started.")
-                    break  # Break out of the loop if successful
-                except discord.NotFound as e:
-                    logger.info(f"An error occurred: {e}. Exiting the function.")
-                    task_manager.new_remove_task(author_id, task_manager_string)
-                    return  # Exiting due to NotFound or Forbidden
-                except discord.Forbidden as e:
-                    logger.info(f"An error occurred: {e}. Exiting the function.")
-                    task_manager.new_remove_task(author_id, task_manager_string)
-                    return  # Exiting due to NotFound or Forbidden
-                except discord.HTTPException as e:
-                    logger.info(f"HTTPException occurred: {e}. Retrying...")
-                    retry_count += 1
-                    if retry_count >= max_retries:
-                        logger.info("Maximum retries reached. Exiting the function.")
-                        task_manager.new_remove_task(author_id, task_manager_string)
-                        return  # Exiting after max retries
-            
-            logger.info("Initial message edited for game not started.")
+        author_id = record["author_id"]
+        game_name = record["game_name"]
 
-            # Instead of sleeping for 5 minutes straight, check more frequently
-            not_started_wait_time = 54000  # 15 hours of total wait time
-            check_interval_long = 3600  # Interval to re-check the game status when it's more than 1 hour until game start
-            check_interval_short = LOOP_WAIT_TIME  # Changed from 45
-            
-            elapsed_time = 0
-            starting_date_str = specific_fixture["response"][0]["fixture"]["date"]
-            starting_date = datetime.strptime(starting_date_str, "%Y-%m-%dT%H:%M:%S%z")
-
-            while elapsed_time < not_started_wait_time:
-
-                """Logging Purposes"""
-                now = datetime.now(starting_date.tzinfo)
-                time_until_game = starting_date - now
-                if time_until_game.total_seconds() > 36000:
-                    sleep_interval = check_interval_long * 10
-                elif time_until_game.total_seconds() > 18000:
-                    sleep_interval = 18000             
-                elif time_until_game.total_seconds() > 3600:
-                    sleep_interval = check_interval_long
-                elif time_until_game.total_seconds() > 1800:
-                    sleep_interval = 1800    
-                elif time_until_game.total_seconds() > 600:
-                    sleep_interval = 600
-                elif time_until_game.total_seconds() > 300:
-                    sleep_interval = 300
-                else:
-                    sleep_interval = check_interval_short
-                
+        logger = await executor.run_io(configure_logging, game_name.replace(" vs ", ""), author_id)
 
-                # dd/mm/YY H:M:S
-                dt_string = now.strftime("%d/%m/%Y %H:%M:%S")
-                logger.debug(f"Game Not Started.{live_stats_dict[0]} Last check at: {dt_string}")
-                logger.info(f"Game Not Started.{live_stats_dict[0]}\nWaiting: {sleep_interval} seconds.")
+        follow = MatchFollow(
+            bot, initial_message, record["fixture_id"], author_id, record["announcement_id"], task_manager, game_name, logger
+        )
+        follow.buttons = CombinedView(follow, author_id, task_manager, {})
+        follow.phase = record["phase"]
+        follow.announced_events = load_event_cursor(record["events"])
 
-                """-------"""
-                await asyncio.sleep(sleep_interval)
-                
-                elapsed_time += sleep_interval
-                
-                # Re-fetch the game status to see if it has changed
-                
-                live_stats_dict = await get_fixtures_statistics(
-                    fixture_id
-                )
-                
-                specific_fixture = live_stats_dict[4]
-                all_buttons.update_stats(specific_fixture)
-
-
-                while retry_count < max_retries:
-                    try:
-                        await initial_message.edit(
-                            content=None,
-                            embed=embed_before_game,
-                            view=all_buttons,
-                        )
-                        logger.debug("Initial message edited for game not started.")
-                        break  # Break out of the loop if successful
-                    except discord.NotFound as e:
-                        logger.info(f"An error occurred: {e}. Exiting the function.")
-                        task_manager.new_remove_task(author_id, task_manager_string)
-                        return  # Exiting due to NotFound or Forbidden
-                    except discord.Forbidden as e:
-                        logger.info(f"An error occurred: {e}. Exiting the function.")
-                        task_manager.new_remove_task(author_id, task_manager_string)
-                        return  # Exiting due to NotFound or Forbidden
-                    except discord.HTTPException as e:
-                        logger.info(f"HTTPException occurred: {e}. Retrying...")
-                        retry_count += 1
-                        if retry_count >= max_retries:
-                            logger.info("Maximum retries reached. Exiting the function.")
-                            task_manager.new_remove_task(author_id, task_manager_string)
-                            return  # Exiting after max retries
-
-
-                logger.debug(f"Current game status: {live_stats_dict[0]}")
-                if 1 == live_stats_dict[0]:
-                    
-                    '''Send 1H Start Here!'''
-                    await game_status_func(bot, specific_fixture, live_stats_dict[1],announcment_id, "Game Started", logger)
-                    
-                    
-                    break  # Exit the loop if game status is no longer "Game Not Started!"
-            # Check if we exited the loop because the wait time was exhausted
-            
-            if elapsed_time >= not_started_wait_time:
-                # Log the timeout or perform any necessary cleanup
-                logger.info("The game did not start within the expected time window. Exiting the function.")
-                task_manager.new_remove_task(author_id, task_manager_string)
-                
-                # Exiting the functiong
-                return
+        task_manager.new_add_task(author_id, game_name)
+        match_engine.add_follow(follow)
 
-        embed1, previous_size = await information_presenter(
-            live_stats_dict[1], bot, previous_size, specific_fixture, task_manager, author_id, announcment_id, logger
-        )
-        
-        # Game Halftime Halt
-        if live_stats_dict[1].get("Game Status") in ("HT", "BT"):
-            
-            '''Send HalfTime Reached here!'''
-            
-            
-            if live_stats_dict[1].get("Game Status") == "HT":
-                await game_status_func(bot, specific_fixture, live_stats_dict[1],announcment_id, "Halftime Reached", logger)
-            elif live_stats_dict[1].get("Game Status") == "BT":
-                await game_status_func(bot, specific_fixture, live_stats_dict[1],announcment_id, "Break Time Reached", logger)
-            
-            
-            retry_count = 0
-            max_retries = 3
-                        
-            while retry_count < max_retries:
-                try:
-                    await initial_message.edit(
-                        content=None,
-                        embed=embed1,
-                        view=all_buttons,
-                    )
-                    logger.debug("Initial message edited for game not started.")
-                    break  # Break out of the loop if successful
-                except discord.NotFound as e:
-                    logger.info(f"An error occurred: {e}. Exiting the function.")
-                    task_manager.new_remove_task(author_id, task_manager_string)
-                    return  # Exiting due to NotFound or Forbidden
-                except discord.Forbidden as e:
-                    logger.info(f"An error occurred: {e}. Exiting the function.")
-                    task_manager.new_remove_task(author_id, task_manager_string)
-                    return  # Exiting due to NotFound or Forbidden
-                except discord.HTTPException as e:
-                    logger.info(f"HTTPException occurred: {e}. Retrying...")
-                    retry_count += 1
-                    if retry_count >= max_retries:
-                        logger.info("Maximum retries reached. Exiting the function.")
-                        task_manager.new_remove_task(author_id, task_manager_string)
-                        return  # Exiting after max retries
-                
-            logger.info(
-                f"Half Time Reached Last check at: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}"
-            )
+        logger.info("Game monitoring resumed after a restart.")
+
+async def update_follow_message(follow, live_stats_dict, phase, transition, dispatcher):
+    """
+    Updates a follower message and sends the announcements for a new fixture snapshot.
+    
+    Parameters:
+    - follow (MatchFollow): Follow being updated
+    - live_stats_dict (list): Result of build_fixture_statistics
+    - phase (str): Phase of the snapshot, e.g. PRE_GAME or LIVE
+    - transition (str): Announcement title if the game changed phase, otherwise None
+    - dispatcher (DiscordDispatcher): Background queue for message edits and announcements
+    """
 
-            # Shorten the sleep duration and re-check the game status more frequently
-            halftime_wait_time = 1800  # 30 minutes total maximum wait
-            elapsed_time = 0
+    logger = follow.logger
+    snapshot = live_stats_dict[1]
+    specific_fixture = live_stats_dict[4]
 
-            while elapsed_time < halftime_wait_time:
-                await asyncio.sleep(LOOP_WAIT_TIME)   # Use configurable wait time
-                elapsed_time += LOOP_WAIT_TIME
-                
-                # Re-fetch the game status
-                live_stats_dict = await get_fixtures_statistics(fixture_id)
-                specific_fixture = live_stats_dict[4]
-                all_buttons.update_stats(specific_fixture)
+    follow.buttons.update_stats(specific_fixture)
 
-                if live_stats_dict[1].get("Game Status") != "HT" and live_stats_dict[1].get("Game Status") != "BT":
-                    
-                    '''Send 2H Start Here!'''
-                    if live_stats_dict[1].get("Game Status") == "2H":    
-                        await game_status_func(bot, specific_fixture, live_stats_dict[1],announcment_id, "Second Half Started", logger)
-                    elif live_stats_dict[1].get("Game Status") == "ET":
-                        await game_status_func(bot, specific_fixture, live_stats_dict[1],announcment_id, "Extra Time Started", logger)
-                    elif live_stats_dict[1].get("Game Status") == "P":
-                        await game_status_func(bot, specific_fixture, live_stats_dict[1],announcment_id, "Penalty Started", logger)
-                    
-                    break  # Exit the loop if game status is no longer "HT"
+    def stop_following(error):
+        # The message was deleted or can't be edited anymore
+        follow.end(f"An error occurred: {error}. Exiting the function.")
 
-        elif live_stats_dict[1].get("Game Status") in ("FT", "AET", "PEN", "ABD"):
-            
-            retry_count = 0
-            max_retries = 3
-                      
-            while retry_count < max_retries:
-                try:
-                    await initial_message.edit(
-                        content=None,
-                        embed=embed1,
-                        view=all_buttons,
-                    )
-                    logger.debug("Initial message edited for game not started.")
-                    break  # Break out of the loop if successful
-                except discord.NotFound as e:
-                    logger.info(f"An error occurred: {e}. Exiting the function.")
-                    task_manager.new_remove_task(author_id, task_manager_string)
-                    return  # Exiting due to NotFound or Forbidden
-                except discord.Forbidden as e:
-                    logger.info(f"An error occurred: {e}. Exiting the function.")
-                    task_manager.new_remove_task(author_id, task_manager_string)
-                    return  # Exiting due to NotFound or Forbidden
-                except discord.HTTPException as e:
-                    logger.info(f"HTTPException occurred: {e}. Retrying...")
-                    retry_count += 1
-                    if retry_count >= max_retries:
-                        logger.info("Maximum retries reached. Exiting the function.")
-                        task_manager.new_remove_task(author_id, task_manager_string)
-                        return  # Exiting after max retries
-            
-            
-            '''Send Final  Game here!'''
-            await game_status_func(bot, specific_fixture, live_stats_dict[1],announcment_id, "Game Ended", logger)
-            
-            logger.info(
-                f"Game Ended Last check at: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}"
-            )
-            task_manager.new_remove_task(author_id, task_manager_string)
-            return
+    # Game Not started halt
+    if phase == PRE_GAME:
 
-        else:
-            
-            retry_count = 0
-            max_retries = 3
-                      
-            while retry_count < max_retries:
-                try:
-                    await initial_message.edit(
-                        content=None,
-                        embed=embed1,
-                        view=all_buttons,
-                    )
-                    logger.debug("Initial message edited for game not started.")
-                    break  # Break out of the loop if successful
-                except discord.NotFound as e:
-                    logger.info(f"An error occurred: {e}. Exiting the function.")
-                    task_manager.new_remove_task(author_id, task_manager_string)
-                    return  # Exiting due to NotFound or Forbidden
-                except discord.Forbidden as e:
-                    logger.info(f"An error occurred: {e}. Exiting the function.")
-                    task_manager.new_remove_task(author_id, task_manager_string)
-                    return  # Exiting due to NotFound or Forbidden
-                except discord.HTTPException as e:
-                    logger.info(f"HTTPException occurred: {e}. Retrying...")
-                    retry_count += 1
-                    if retry_count >= max_retries:
-                        logger.info("Maximum retries reached. Exiting the function.")
-                        task_manager.new_remove_task(author_id, task_manager_string)
-                        return  # Exiting after max retries
-            
-            logger.info(
-                f"Game in Progress: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}"
-            )
+        embed_before_game = live_stats_dict[3]
+        embed_before_game.set_image(url=f"attachment://{BANNER_ATTACHMENT}")  # Use the same attachment filename
+
+        # Unchanged embeds are dropped by the dispatcher
+        dispatcher.queue_edit(follow.message, embed_before_game, follow.buttons, on_failure=stop_following)
+
+        """Logging Purposes"""
+        # dd/mm/YY H:M:S
+        dt_string = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+        logger.debug(f"Game Not Started.{live_stats_dict[0]} Last check at: {dt_string}")
+        return
+
+    # Kickoff and restarts are announced before the events of the snapshot
+    if transition is not None and phase == LIVE:
+        await game_status_func(follow.bot, specific_fixture, snapshot, follow.announcement_id, transition, logger, dispatcher)
+
+    changes = diff_snapshots(follow.previous_fixture, specific_fixture)
+    follow.previous_fixture = specific_fixture
 
-        await asyncio.sleep(LOOP_WAIT_TIME)  # Changed from 45
+    # Quiet tick, nothing to render or announce
+    if not changes:
+        logger.debug("No changes since the last snapshot.")
+        return
 
+    for change in changes:
+        if change.kind in (EVENT_REMOVED, EVENT_AMENDED):
+            logger.info(f"Event {change.kind}: {change.before} -> {change.after}")
+
+    events = specific_fixture["response"][0]["events"] or []
+    new_events = get_new_events(events, follow.announced_events)
+    # Every event of the snapshot is announced now, or paired with one announced before
+    follow.announced_events = [event_key(event) for event in events]
+
+    embed1 = await information_presenter(
+        snapshot, follow.bot, new_events, specific_fixture, follow.task_manager, follow.author_id, follow.announcement_id, logger, dispatcher
+    )
+
+    dispatcher.queue_edit(follow.message, embed1, follow.buttons, on_failure=stop_following)
+
+    # Halftime, breaks and the final whistle are announced after them
+    if transition is not None and phase != LIVE:
+        await game_status_func(follow.bot, specific_fixture, snapshot, follow.announcement_id, transition, logger, dispatcher)
+
+    logger.info(
+        f"Game {snapshot.status}: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}"
+    )
@@ -0,0 +1,208 @@
+import asyncio
+import hashlib
+import json
+from collections import deque, OrderedDict
+
+import discord
+
+from common_utils.time_logging import configure_logging
+
+# Fingerprints kept for the most recently edited messages
+MAX_TRACKED_MESSAGES = 5000
+# Seconds before the first retry of a failed edit, doubled on every further attempt
+RETRY_DELAY = 1
+
+
+def embed_fingerprint(embed):
+    """
+    Hashes the content of an embed, ignoring its timestamp.
+
+    Parameters:
+    - embed (discord.Embed): Embed about to be sent
+
+    Returns:
+    - str: Digest that only changes when the embed would look different
+    """
+    embed_dict = embed.to_dict()
+    embed_dict.pop("timestamp", None)
+
+    return hashlib.blake2b(
+        json.dumps(embed_dict, sort_keys=True, ensure_ascii=False).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+
+
+class DiscordDispatcher:
+    def __init__(self, max_retries=3):
+        """
+        Delivers message edits and announcements in the background, one queue per channel.
+
+        Announcements keep their order and go out before edits in the same channel.
+        Pending edits to the same message collapse into the newest one.
+
+        Parameters:
+        - max_retries (int): Attempts before giving up on an HTTP error
+        """
+        self.max_retries = max_retries
+
+        # {channel_id: {"announcements": deque, "edits": {message_id: pending edit}}}
+        self.channels = {}
+        # {channel_id: asyncio.Task} draining that channel
+        self.workers = {}
+        # {message_id: fingerprint of the content last delivered}
+        self.sent_fingerprints = OrderedDict()
+        # {message_id: fingerprint of the edit being delivered right now}
+        self.in_flight_fingerprints = {}
+
+        self.logger = configure_logging("discord_dispatcher", "system")
+
+    def get_channel_queue(self, channel_id):
+        if channel_id not in self.channels:
+            self.channels[channel_id] = {"announcements": deque(), "edits": {}}
+        return self.channels[channel_id]
+
+    def queue_send(self, channel, embed, file=None, on_sent=None):
+        """
+        Queues an announcement, returning immediately.
+
+        Parameters:
+        - channel (discord.abc.Messageable): Channel to send to
+        - embed (discord.Embed): Announcement embed
+        - file (discord.File): Optional attachment
+        - on_sent (callable): Called with the sent message, e.g. to keep its attachment URL
+        """
+        self.get_channel_queue(channel.id)["announcements"].append((channel, embed, file, on_sent))
+        self.start_worker(channel.id)
+
+    def queue_edit(self, message, embed, view=None, on_failure=None):
+        """
+        Queues an edit of a message, replacing any edit of it still waiting.
+
+        Parameters:
+        - message (discord.Message): Message to edit
+        - embed (discord.Embed): New embed for the message
+        - view (discord.ui.View): Buttons attached to the message
+        - on_failure (callable): Called with the exception if the message can't be edited anymore
+        """
+        fingerprint = embed_fingerprint(embed)
+
+        # What the message shows once the edit under way, if any, is delivered
+        shown = self.in_flight_fingerprints.get(message.id, self.sent_fingerprints.get(message.id))
+
+        # Same content as what the message will show, nothing to send
+        if fingerprint == shown:
+            channel_queue = self.channels.get(message.channel.id)
+            if channel_queue is not None:
+                channel_queue["edits"].pop(message.id, None)
+            return
+
+        edits = self.get_channel_queue(message.channel.id)["edits"]
+        edits[message.id] = (message, embed, view, on_failure, fingerprint)
+        self.start_worker(message.channel.id)
+
+    def cancel_edits(self, message):
+        """
+        Drops any edit of a message still waiting, e.g. once its follow was stopped.
+
+        Parameters:
+        - message (discord.Message): Message whose edits are dropped
+        """
+        channel_queue = self.channels.get(message.channel.id)
+        if channel_queue is not None:
+            channel_queue["edits"].pop(message.id, None)
+        self.sent_fingerprints.pop(message.id, None)
+
+    def start_worker(self, channel_id):
+        worker = self.workers.get(channel_id)
+        if worker is None or worker.done():
+            self.workers[channel_id] = asyncio.create_task(self._drain_channel(channel_id))
+
+    async def _drain_channel(self, channel_id):
+        """
+        Delivers everything queued for a channel, announcements first.
+
+        Parameters:
+        - channel_id (int): Channel to drain
+        """
+        channel_queue = self.channels[channel_id]
+
+        while channel_queue["announcements"] or channel_queue["edits"]:
+            try:
+                if channel_queue["announcements"]:
+                    await self._send(*channel_queue["announcements"].popleft())
+                else:
+                    message_id = next(iter(channel_queue["edits"]))
+                    await self._edit(*channel_queue["edits"].pop(message_id))
+            except Exception as e:
+                # One bad item must not stall the rest of the channel
+                self.logger.error(f"Unexpected error delivering to channel {channel_id}: {e}")
+
+        del self.channels[channel_id]
+
+    async def _send(self, channel, embed, file, on_sent):
+        try:
+            message = await channel.send(content=None, embed=embed, file=file)
+            if on_sent is not None:
+                on_sent(message)
+        except discord.Forbidden:
+            self.logger.warning(f"Missing permissions to send messages in channel {channel.id}")
+        except discord.HTTPException as e:
+            self.logger.error(f"Failed to send message in channel {channel.id}: {e}")
+
+    async def _edit(self, message, embed, view, on_failure, fingerprint):
+        self.in_flight_fingerprints[message.id] = fingerprint
+        try:
+            await self._deliver_edit(message, embed, view, on_failure, fingerprint)
+        finally:
+            self.in_flight_fingerprints.pop(message.id, None)
+
+    async def _deliver_edit(self, message, embed, view, on_failure, fingerprint):
+        retry_count = 0
+        while retry_count < self.max_retries:
+            try:
+                await message.edit(content=None, embed=embed, view=view)
+                self.remember_fingerprint(message.id, fingerprint)
+                return
+            except (discord.NotFound, discord.Forbidden) as e:
+                self.logger.info(f"Message {message.id} can't be edited anymore: {e}")
+                self.sent_fingerprints.pop(message.id, None)
+                if on_failure is not None:
+                    on_failure(e)
+                return
+            except discord.HTTPException as e:
+                last_error = e
+                retry_count += 1
+                if retry_count < self.max_retries:
+                    delay = self.get_retry_delay(e, retry_count)
+                    self.logger.info(f"HTTPException occurred: {e}. Retrying in {delay:.1f} seconds...")
+                    await asyncio.sleep(delay)
+
+        self.logger.info(f"Maximum retries reached editing message {message.id}.")
+        if on_failure is not None:
+            on_failure(last_error)
+
+    @staticmethod
+    def get_retry_delay(error, retry_count):
+        """
+        Parameters:
+        - error (discord.HTTPException): Error of the failed attempt
+        - retry_count (int): Attempts failed so far
+
+        Returns:
+        - float: Seconds to wait, the Retry-After of a 429 or an exponential backoff
+        """
+        if error.status == 429:
+            response = getattr(error, "response", None)
+            retry_after = response.headers.get("Retry-After") if response is not None else None
+            try:
+                return float(retry_after)
+            except (TypeError, ValueError):
+                pass
+        return RETRY_DELAY * 2 ** (retry_count - 1)
+
+    def remember_fingerprint(self, message_id, fingerprint):
+        self.sent_fingerprints[message_id] = fingerprint
+        self.sent_fingerprints.move_to_end(message_id)
+
+        if len(self.sent_fingerprints) > MAX_TRACKED_MESSAGES:
+            self.sent_fingerprints.popitem(last=False)
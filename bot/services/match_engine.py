@@ -0,0 +1,397 @@
+import asyncio
+import heapq
+import time
+from datetime import datetime
+
+from common_utils.time_logging import configure_logging
+from common_utils.quota_governor import quota_governor
+
+from configs.config import LOOP_WAIT_TIME, PRE_GAME_WINDOW
+
+# Phases a fixture goes through
+PRE_GAME = "pre_game"
+LIVE = "live"
+BREAK = "break"
+FINISHED = "finished"
+
+# Phase of every short status the engine knows
+STATES = {
+    "NS": PRE_GAME,
+    "1H": LIVE,
+    "HT": BREAK,
+    "2H": LIVE,
+    "BT": BREAK,
+    "ET": LIVE,
+    "P": LIVE,
+    "FT": FINISHED,
+    "AET": FINISHED,
+    "PEN": FINISHED,
+    "ABD": FINISHED,
+}
+
+# Announcement sent when a follow moves from a phase to a status
+TRANSITIONS = {
+    (PRE_GAME, "1H"): "Game Started",
+    (LIVE, "HT"): "Halftime Reached",
+    (LIVE, "BT"): "Break Time Reached",
+    (BREAK, "2H"): "Second Half Started",
+    (BREAK, "ET"): "Extra Time Started",
+    (BREAK, "P"): "Penalty Started",
+    (LIVE, "FT"): "Game Ended",
+    (LIVE, "AET"): "Game Ended",
+    (LIVE, "PEN"): "Game Ended",
+    (LIVE, "ABD"): "Game Ended",
+    (BREAK, "FT"): "Game Ended",
+    (BREAK, "AET"): "Game Ended",
+    (BREAK, "PEN"): "Game Ended",
+    (BREAK, "ABD"): "Game Ended",
+}
+
+# Follows of a game that doesn't start within 15 hours are dropped
+PRE_GAME_TIMEOUT = 54000
+
+# Timers due this close together are fetched in the same batch
+BATCH_SLACK = 1
+
+
+def get_phase(live_stats_dict):
+    """
+    Looks up the phase of a fixture snapshot.
+
+    Parameters:
+    - live_stats_dict (list): Result of build_fixture_statistics
+
+    Returns:
+    - str: PRE_GAME, LIVE, BREAK or FINISHED
+    """
+    phase = STATES.get(live_stats_dict[1].status)
+    if phase is None:
+        # Statuses outside the table, e.g. "SUSP", follow the elapsed time
+        phase = LIVE if live_stats_dict[0] == 1 else PRE_GAME
+    return phase
+
+
+class MatchFollow:
+    def __init__(self, bot, message, fixture_id, author_id, announcement_id, task_manager, game_name, logger, kickoff=None):
+        """
+        State of a single follower message, updated by the match engine.
+
+        Parameters:
+        - bot (discord.Client): Bot instance
+        - message (discord.Message): Follower message edited with the game stats
+        - fixture_id (int): The unique identifier for the fixture
+        - author_id (int): Discord user ID who started the follow
+        - announcement_id (int): Channel ID for announcements
+        - task_manager (TaskManager): Task management instance
+        - game_name (str): "Home vs Away" name used by the task manager
+        - logger (logging.Logger): Logger of the follow
+        - kickoff (datetime): Kickoff time from the local fixture index, None if unknown
+        """
+        self.bot = bot
+        self.message = message
+        self.fixture_id = fixture_id
+        self.author_id = author_id
+        self.announcement_id = announcement_id
+        self.task_manager = task_manager
+        self.game_name = game_name
+        self.logger = logger
+        self.kickoff = kickoff
+
+        # Set when the follow is added to the engine
+        self.engine = None
+        self.buttons = None
+
+        # Phase of the last snapshot handled, None until the first one
+        self.phase = None
+        self.previous_fixture = None
+        # Keys of the events already announced, kept in the follow journal, None until known after a restart
+        self.announced_events = []
+        self.followed_since = None
+        self.active = False
+
+    def cancel(self):
+        """Stops the follow from the "Stop the Game!" button, dropping its pending edits."""
+        if self.active:
+            self.engine.remove_follow(self)
+            self.engine.dispatcher.cancel_edits(self.message)
+
+    def end(self, reason):
+        """
+        Stops the follow on its own, e.g. once the game ended.
+
+        Parameters:
+        - reason (str): Logged reason for stopping
+        """
+        if self.active:
+            self.logger.info(reason)
+            self.task_manager.new_remove_task(self.author_id, self.game_name)
+            self.engine.remove_follow(self)
+
+
+class MatchEngine:
+    def __init__(self, batch_fetch_func, update_func, dispatcher, journal=None):
+        """
+        Drives every followed fixture from a single scheduler.
+
+        Fixtures wait in a timer heap keyed by their next poll time, so an idle follow
+        costs one heap entry instead of a suspended coroutine.
+
+        Parameters:
+        - batch_fetch_func (coroutine function): Fetches several fixtures at once,
+          e.g. get_batch_fixtures_statistics, returning {fixture_id: live_stats_dict}
+        - update_func (coroutine function): Renders a snapshot for one follow,
+          called as update_func(follow, live_stats_dict, phase, transition, dispatcher)
+        - dispatcher (DiscordDispatcher): Background queue for message edits and announcements
+        - journal (FollowJournal): Records the follows so they can be resumed after a restart
+        """
+        self.batch_fetch_func = batch_fetch_func
+        self.update_func = update_func
+        self.dispatcher = dispatcher
+        self.journal = journal
+
+        # {fixture_id: {"follows": [MatchFollow], "latest": list, "next_poll": float}}
+        self.fixtures = {}
+        # Heap of (next_poll, fixture_id), entries whose next_poll changed are skipped
+        self.timers = []
+        self.task = None
+        self.wake_up = asyncio.Event()
+        self.logger = configure_logging("match_engine", "system")
+
+    def add_follow(self, follow):
+        """
+        Starts updating a follow. A new fixture is first polled when its pre-game window opens.
+
+        Parameters:
+        - follow (MatchFollow): Follow to update
+        """
+        loop = asyncio.get_running_loop()
+
+        follow.engine = self
+        follow.active = True
+        follow.followed_since = loop.time()
+
+        entry = self.fixtures.get(follow.fixture_id)
+        if entry is None:
+            entry = {"follows": [], "latest": None, "next_poll": None}
+            self.fixtures[follow.fixture_id] = entry
+            self.logger.info(f"Polling started for fixture {follow.fixture_id}")
+            self.schedule(follow.fixture_id, loop.time() + self.pre_game_wait(follow.kickoff))
+
+        entry["follows"].append(follow)
+
+        if self.journal is not None:
+            self.journal.record_follow(follow)
+
+        # Late followers get the current state straight away
+        if entry["latest"] is not None:
+            asyncio.create_task(self.update_follow(follow, entry["latest"]))
+
+    def remove_follow(self, follow):
+        """
+        Stops updating a follow and forgets its fixture once nobody follows it.
+
+        Parameters:
+        - follow (MatchFollow): Follow to remove
+        """
+        follow.active = False
+
+        if self.journal is not None:
+            self.journal.record_end(follow)
+
+        entry = self.fixtures.get(follow.fixture_id)
+        if entry is None:
+            return
+
+        if follow in entry["follows"]:
+            entry["follows"].remove(follow)
+
+        if not entry["follows"]:
+            del self.fixtures[follow.fixture_id]
+            self.logger.info(f"Polling stopped for fixture {follow.fixture_id}")
+            self.wake_up.set()
+
+    def get_follower_count(self, fixture_id):
+        """
+        Gets the number of follows of a fixture.
+
+        Parameters:
+        - fixture_id (int): The unique identifier for the fixture
+
+        Returns:
+        - int: Number of active follows
+        """
+        entry = self.fixtures.get(fixture_id)
+        return len(entry["follows"]) if entry else 0
+
+    def schedule(self, fixture_id, due):
+        """
+        Sets the next poll time of a fixture.
+
+        Parameters:
+        - fixture_id (int): The unique identifier for the fixture
+        - due (float): Loop time of the next poll
+        """
+        self.fixtures[fixture_id]["next_poll"] = due
+        heapq.heappush(self.timers, (due, fixture_id))
+
+        # Wake the scheduler if this fixture is due before whatever it waits for
+        self.wake_up.set()
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+
+    def next_interval(self, live_stats_dict):
+        """
+        Works out how long to wait before polling a fixture again.
+
+        Parameters:
+        - live_stats_dict (list): Result of build_fixture_statistics
+
+        Returns:
+        - int: Seconds until the next poll
+        """
+        # Poll less often when the API quota is running low
+        if live_stats_dict[0] == 1:
+            return quota_governor.throttle(LOOP_WAIT_TIME)
+
+        # Game not started, wait for its pre-game window, e.g. after a kickoff was moved
+        starting_date_str = live_stats_dict[4]["response"][0]["fixture"]["date"]
+        starting_date = datetime.strptime(starting_date_str, "%Y-%m-%dT%H:%M:%S%z")
+
+        wait = self.pre_game_wait(starting_date)
+        if wait > 0:
+            return wait
+        return quota_governor.throttle(LOOP_WAIT_TIME)
+
+    def pre_game_wait(self, kickoff):
+        """
+        Works out how long a game can go without polls before kickoff.
+
+        Parameters:
+        - kickoff (datetime): Timezone aware kickoff time, None if unknown
+
+        Returns:
+        - float: Seconds until the pre-game window opens, 0 if it is already open
+        """
+        if kickoff is None:
+            return 0
+
+        window_start = kickoff.timestamp() - PRE_GAME_WINDOW
+
+        # Windows start on a fixed grid so games kicking off close together are checked in one batch
+        if PRE_GAME_WINDOW > 0:
+            window_start -= window_start % PRE_GAME_WINDOW
+
+        # Wake up in time to drop follows of games that never start
+        return max(0, min(window_start - time.time(), PRE_GAME_TIMEOUT))
+
+    def pop_due(self, now):
+        """
+        Takes every fixture due for a poll off the timer heap.
+
+        Parameters:
+        - now (float): Current loop time
+
+        Returns:
+        - list: Fixture ids to poll
+        """
+        due_ids = []
+        while self.timers and self.timers[0][0] <= now + BATCH_SLACK:
+            due, fixture_id = heapq.heappop(self.timers)
+            entry = self.fixtures.get(fixture_id)
+
+            # Unfollowed or rescheduled since this timer was pushed
+            if entry is None or entry["next_poll"] != due or fixture_id in due_ids:
+                continue
+            due_ids.append(fixture_id)
+        return due_ids
+
+    async def update_follow(self, follow, live_stats_dict):
+        """
+        Moves a follow through the state table and renders the snapshot for it.
+
+        Parameters:
+        - follow (MatchFollow): Follow to update
+        - live_stats_dict (list): Result of build_fixture_statistics
+        """
+        if not follow.active:
+            return
+
+        phase = get_phase(live_stats_dict)
+        transition = None
+        if follow.phase is not None and follow.phase != phase:
+            transition = TRANSITIONS.get((follow.phase, live_stats_dict[1].status))
+
+        previous_phase = follow.phase
+        # update_func replaces the list instead of changing it
+        announced_before = follow.announced_events
+
+        try:
+            await self.update_func(follow, live_stats_dict, phase, transition, self.dispatcher)
+        except Exception as e:
+            follow.logger.error(f"Unexpected error updating the follow: {e}")
+
+        follow.phase = phase
+
+        # Move the journal cursor so a restart doesn't announce anything twice
+        if self.journal is not None and follow.active and (
+            phase != previous_phase or follow.announced_events != announced_before
+        ):
+            self.journal.record_follow(follow)
+
+        if phase == FINISHED:
+            follow.end(f"Game Ended Last check at: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
+        elif phase == PRE_GAME:
+            waited = asyncio.get_running_loop().time() - follow.followed_since
+            # pop_due runs timers up to BATCH_SLACK early, the poll meant to drop the follow included
+            if waited + BATCH_SLACK >= PRE_GAME_TIMEOUT:
+                follow.end("The game did not start within the expected time window. Exiting the function.")
+
+    async def _run(self):
+        """
+        Polls every due fixture in one batch per tick and updates its follows.
+        Exits once no fixture is followed anymore.
+        """
+        loop = asyncio.get_running_loop()
+
+        while self.fixtures:
+            self.wake_up.clear()
+            due_ids = self.pop_due(loop.time())
+
+            if due_ids:
+                try:
+                    results = await self.batch_fetch_func(due_ids)
+                except Exception as e:
+                    self.logger.error(f"Failed to poll fixtures {due_ids}: {e}")
+                    results = {}
+
+                for fixture_id in due_ids:
+                    entry = self.fixtures.get(fixture_id)
+                    if entry is None:
+                        continue
+
+                    live_stats_dict = results.get(fixture_id)
+                    if live_stats_dict is None:
+                        # Retry on the next regular tick
+                        self.schedule(fixture_id, loop.time() + quota_governor.throttle(LOOP_WAIT_TIME))
+                        continue
+
+                    entry["latest"] = live_stats_dict
+                    for follow in list(entry["follows"]):
+                        await self.update_follow(follow, live_stats_dict)
+
+                    # Finished fixtures drop out as their follows end
+                    if fixture_id in self.fixtures and get_phase(live_stats_dict) != FINISHED:
+                        self.schedule(fixture_id, loop.time() + self.next_interval(live_stats_dict))
+
+                self.logger.info(
+                    f"Polled {len(due_ids)} fixtures for {sum(len(entry['follows']) for entry in self.fixtures.values())} followers."
+                )
+
+            # Stale timers of unfollowed fixtures are skipped by pop_due
+            sleep_interval = max(0, self.timers[0][0] - loop.time()) if self.timers else None
+
+            # Sleep until the next fixture is due or a new fixture gets followed
+            try:
+                await asyncio.wait_for(self.wake_up.wait(), timeout=sleep_interval)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,130 @@
+# Statistic types reported by API-Football, in the order they are stored in the stats arrays
+STAT_TYPES = (
+    "Shots on Goal",
+    "Shots off Goal",
+    "Total Shots",
+    "Blocked Shots",
+    "Shots insidebox",
+    "Shots outsidebox",
+    "Fouls",
+    "Corner Kicks",
+    "Offsides",
+    "Ball Possession",
+    "Yellow Cards",
+    "Red Cards",
+    "Goalkeeper Saves",
+    "Total passes",
+    "Passes accurate",
+    "Passes %",
+    "expected_goals",
+    "goals_prevented",
+)
+STAT_INDEX = {stat_type: index for index, stat_type in enumerate(STAT_TYPES)}
+
+# Indexes of the stats shown in the game status embed
+SHOTS_ON_GOAL = STAT_INDEX["Shots on Goal"]
+CORNER_KICKS = STAT_INDEX["Corner Kicks"]
+BALL_POSSESSION = STAT_INDEX["Ball Possession"]
+
+
+def parse_stat_value(value):
+    """
+    Converts an API statistic value to a number.
+
+    Parameters:
+    - value: Raw value, e.g. 7, "55%", "1.34" or None
+
+    Returns:
+    - int or float: The value as a number, 0 when missing
+    """
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        value = value.strip().rstrip("%")
+        if not value:
+            return 0
+        return float(value) if "." in value else int(value)
+    return value
+
+
+class MatchSnapshot:
+    """
+    State of a fixture at one poll, with fixed home/away fields and one stats array per team.
+    """
+    __slots__ = (
+        "status",
+        "elapsed",
+        "home_team",
+        "away_team",
+        "home_goals",
+        "away_goals",
+        "home_halftime",
+        "away_halftime",
+        "first_scorer",
+        "home_stats",
+        "away_stats",
+    )
+
+    def __init__(self, status, elapsed, home_team, away_team):
+        """
+        Parameters:
+        - status (str): Short game status, e.g. "NS", "1H" or "FT"
+        - elapsed (int): Minutes played, 0 before kickoff
+        - home_team (str): Home team name
+        - away_team (str): Away team name
+        """
+        self.status = status
+        self.elapsed = elapsed
+        self.home_team = home_team
+        self.away_team = away_team
+        self.home_goals = 0
+        self.away_goals = 0
+        self.home_halftime = 0
+        self.away_halftime = 0
+        self.first_scorer = "none"
+        self.home_stats = [0] * len(STAT_TYPES)
+        self.away_stats = [0] * len(STAT_TYPES)
+
+    @classmethod
+    def from_fixture(cls, specific_fixture):
+        """
+        Builds a snapshot in a single pass over a fixture API response.
+
+        Parameters:
+        - specific_fixture (dict): Raw fixture API response holding a single fixture
+
+        Returns:
+        - MatchSnapshot: Snapshot of the fixture
+        """
+        fixture = specific_fixture["response"][0]
+        teams = fixture["teams"]
+
+        snapshot = cls(
+            str(fixture["fixture"]["status"]["short"]),
+            int(fixture["fixture"]["status"]["elapsed"] or 0),
+            str(teams["home"]["name"]),
+            str(teams["away"]["name"]),
+        )
+
+        snapshot.home_goals = int(fixture["goals"]["home"] or 0)
+        snapshot.away_goals = int(fixture["goals"]["away"] or 0)
+
+        halftime = fixture["score"]["halftime"]
+        snapshot.home_halftime = int(halftime["home"] or 0)
+        snapshot.away_halftime = int(halftime["away"] or 0)
+
+        # Teams are matched by id so similar team names can't be mixed up
+        home_id = teams["home"]["id"]
+        for team_stats in fixture.get("statistics") or []:
+            stats = snapshot.home_stats if team_stats["team"]["id"] == home_id else snapshot.away_stats
+            for stat in team_stats["statistics"]:
+                index = STAT_INDEX.get(stat["type"])
+                if index is not None:
+                    stats[index] = parse_stat_value(stat["value"])
+
+        for event in fixture.get("events") or []:
+            if event["type"] == "Goal" and event["detail"] != "Missed Penalty":
+                snapshot.first_scorer = str(event["team"]["name"])
+                break
+
+        return snapshot
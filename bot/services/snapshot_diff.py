@@ -0,0 +1,199 @@
+from collections import namedtuple
+
+# Kinds of change reported between two fixture snapshots
+SCORE_CHANGED = "score_changed"
+STATUS_CHANGED = "status_changed"
+ELAPSED_CHANGED = "elapsed_changed"
+EVENT_ADDED = "event_added"
+EVENT_REMOVED = "event_removed"
+EVENT_AMENDED = "event_amended"
+STAT_CHANGED = "stat_changed"
+
+# Minutes a corrected event may move when its player changed too
+AMEND_WINDOW = 5
+
+# kind: one of the kinds above
+# key: what changed, e.g. ("home", "Corner Kicks") for a stat or the event_key for events
+# before / after: old and new value, None when there is no old or new value
+FixtureChange = namedtuple("FixtureChange", ["kind", "key", "before", "after"])
+
+
+def event_key(event):
+    """
+    Builds the key an event is announced and journaled under.
+
+    Parameters:
+    - event (dict): Event from the fixture API response
+
+    Returns:
+    - tuple: (type, team_id, detail, player, elapsed, extra)
+    """
+    return (
+        event["type"],
+        event["team"]["id"],
+        event["detail"],
+        event["player"]["id"] or event["player"]["name"],
+        event["time"]["elapsed"],
+        event["time"]["extra"],
+    )
+
+
+def get_event_minute(key):
+    """
+    Parameters:
+    - key (tuple): Result of event_key
+
+    Returns:
+    - int: Minute of the event, stoppage time included
+    """
+    return (key[4] or 0) + (key[5] or 0)
+
+
+def match_events(previous_keys, current_keys):
+    """
+    Pairs the events of two snapshots, so a corrected event isn't taken for a new one.
+
+    Events only pair within the same type, team and detail, e.g. a yellow card never
+    pairs with a red one. Identical events pair first, then events of the same player
+    at the nearest minute, then events at most AMEND_WINDOW minutes apart. Positions
+    in the lists play no part, so an event entered late doesn't move the others.
+
+    Parameters:
+    - previous_keys (list): event_key of every previous event
+    - current_keys (list): event_key of every current event
+
+    Returns:
+    - dict: {current index: previous index} of the paired events
+    """
+    pairs = {}
+    unpaired = set(range(len(previous_keys)))
+
+    by_key = {}
+    for index, key in enumerate(previous_keys):
+        by_key.setdefault(key, []).append(index)
+    for index, key in enumerate(current_keys):
+        if by_key.get(key):
+            pairs[index] = by_key[key].pop(0)
+            unpaired.discard(pairs[index])
+
+    for same_player in (True, False):
+        # (minutes apart, current index, previous index), nearest pairs are taken first
+        candidates = []
+        for index, key in enumerate(current_keys):
+            if index in pairs:
+                continue
+            for previous_index in unpaired:
+                previous_key = previous_keys[previous_index]
+                if key[:3] != previous_key[:3]:
+                    continue
+                distance = abs(get_event_minute(key) - get_event_minute(previous_key))
+                if (key[3] == previous_key[3]) if same_player else distance <= AMEND_WINDOW:
+                    candidates.append((distance, index, previous_index))
+
+        for _, index, previous_index in sorted(candidates):
+            if index not in pairs and previous_index in unpaired:
+                pairs[index] = previous_index
+                unpaired.discard(previous_index)
+
+    return pairs
+
+
+def index_stats(fixture):
+    """
+    Flattens the statistics of both teams.
+
+    Parameters:
+    - fixture (dict): Single fixture from the API response, i.e. response[0]
+
+    Returns:
+    - dict: {(side, stat_type): value} with side "home" or "away"
+    """
+    home_id = fixture["teams"]["home"]["id"]
+    stats = {}
+    for team_stats in fixture.get("statistics") or []:
+        side = "home" if team_stats["team"]["id"] == home_id else "away"
+        for stat in team_stats["statistics"]:
+            stats[(side, stat["type"])] = stat["value"]
+    return stats
+
+
+def diff_snapshots(previous_fixture, specific_fixture):
+    """
+    Compares two consecutive fixture snapshots.
+
+    Parameters:
+    - previous_fixture (dict): Raw fixture API response from the last poll, or None on the first poll
+    - specific_fixture (dict): Raw fixture API response from this poll
+
+    Returns:
+    - list: FixtureChange records, empty when nothing changed.
+      On the first poll every event is reported as added.
+    """
+    current = specific_fixture["response"][0]
+    previous = previous_fixture["response"][0] if previous_fixture else None
+
+    changes = []
+
+    previous_status = previous["fixture"]["status"]["short"] if previous else None
+    if current["fixture"]["status"]["short"] != previous_status:
+        changes.append(FixtureChange(STATUS_CHANGED, "status", previous_status, current["fixture"]["status"]["short"]))
+
+    previous_elapsed = previous["fixture"]["status"]["elapsed"] if previous else None
+    if current["fixture"]["status"]["elapsed"] != previous_elapsed:
+        changes.append(FixtureChange(ELAPSED_CHANGED, "elapsed", previous_elapsed, current["fixture"]["status"]["elapsed"]))
+
+    previous_score = (previous["goals"]["home"], previous["goals"]["away"]) if previous else None
+    current_score = (current["goals"]["home"], current["goals"]["away"])
+    if current_score != previous_score:
+        changes.append(FixtureChange(SCORE_CHANGED, "goals", previous_score, current_score))
+
+    previous_events = (previous["events"] or []) if previous else []
+    current_events = current["events"] or []
+    previous_keys = [event_key(event) for event in previous_events]
+    current_keys = [event_key(event) for event in current_events]
+    pairs = match_events(previous_keys, current_keys)
+
+    for index, event in enumerate(current_events):
+        old_event = previous_events[pairs[index]] if index in pairs else None
+        if old_event is None:
+            changes.append(FixtureChange(EVENT_ADDED, current_keys[index], None, event))
+        elif (previous_keys[pairs[index]], old_event["comments"]) != (current_keys[index], event["comments"]):
+            # Same event with different details, e.g. a goal reviewed by VAR or given to another player
+            changes.append(FixtureChange(EVENT_AMENDED, current_keys[index], old_event, event))
+
+    paired = set(pairs.values())
+    for index, old_event in enumerate(previous_events):
+        if index not in paired:
+            changes.append(FixtureChange(EVENT_REMOVED, previous_keys[index], old_event, None))
+
+    previous_stats = index_stats(previous) if previous else {}
+    current_stats = index_stats(current)
+
+    for key, value in current_stats.items():
+        if previous_stats.get(key) != value:
+            changes.append(FixtureChange(STAT_CHANGED, key, previous_stats.get(key), value))
+
+    return changes
+
+
+def get_new_events(events, announced=()):
+    """
+    Picks the events not announced yet.
+
+    The events are paired with the announced ones as in diff_snapshots, so an event
+    corrected since it was announced, even while the bot was down, isn't announced again.
+
+    Parameters:
+    - events (list): Events from the fixture API response
+    - announced (list): Keys of the events already announced, see event_key.
+      None if they are unknown, every event is then taken as announced.
+
+    Returns:
+    - list: Event dicts in the order they happened
+    """
+    if announced is None:
+        return []
+
+    events = events or []
+    pairs = match_events(list(announced), [event_key(event) for event in events])
+    return [event for index, event in enumerate(events) if index not in pairs]
@@ -0,0 +1,312 @@
+import asyncio
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import aiohttp
+
+from common_utils.executor import executor
+from common_utils.time_logging import configure_logging
+from common_utils.fixture_utils import get_fixtures_batch
+from common_utils.quota_governor import quota_governor
+from common_utils.fixture_store import INACTIVE_STATUSES
+from configs.config import FIXTURES_PATH, STANDINGS_PATH, INDEX_REFRESH_INTERVAL, LEAGUE_DATA_TTL, INDEX_REFRESH_MIN_BUDGET
+
+# Same timezone the setup scripts download the fixtures in
+FIXTURES_TIMEZONE = "Europe/London"
+# Days after today whose fixtures are checked on every refresh, yesterday is always included
+REFRESH_WINDOW_DAYS = 2
+
+
+def read_leagues():
+    """
+    Reads the downloaded fixture files of every tracked league.
+
+    Returns:
+    - dict: {league_id: {"path", "name", "season", "age", "fixtures": {fixture_id: fixture}}}
+    """
+    leagues = {}
+    for entry in os.scandir(FIXTURES_PATH):
+        if not entry.is_file():
+            continue
+
+        with open(entry.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not data.get("response"):
+            continue
+
+        league = data["response"][0]["league"]
+        leagues[league["id"]] = {
+            "path": entry.path,
+            "name": league["name"],
+            "season": league["season"],
+            "age": time.time() - entry.stat().st_mtime,
+            "fixtures": {fixture["fixture"]["id"]: fixture for fixture in data["response"]},
+        }
+    return leagues
+
+
+def write_json(path, data):
+    # Written under a temporary name so the bot never reads half a file
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+    os.replace(temp_path, path)
+
+
+def get_index_key(fixture):
+    """
+    Parameters:
+    - fixture (dict): Fixture from the API
+
+    Returns:
+    - tuple: The fields the team index is built from, (kickoff, home id, away id, inactive)
+      with inactive True for a postponed, cancelled or abandoned game
+    """
+    # Only whether the game is still on matters, so games going live or ending don't rewrite the files
+    return (
+        datetime.fromisoformat(fixture["fixture"]["date"]),
+        fixture["teams"]["home"]["id"],
+        fixture["teams"]["away"]["id"],
+        fixture["fixture"]["status"]["short"] in INACTIVE_STATUSES,
+    )
+
+
+class IndexRefresher:
+    def __init__(self, api_client, interval=INDEX_REFRESH_INTERVAL, ttl=LEAGUE_DATA_TTL, min_budget=INDEX_REFRESH_MIN_BUDGET):
+        """
+        Keeps the fixture and standings files and the team index current while the bot runs.
+
+        Every refresh pulls the fixtures of the days around today, a few calls covering
+        every league, and re-pulls in full the leagues whose files are older than the TTL.
+        Only changes to kickoffs, teams or postponements are written, the fixture store
+        imports them off the event loop in one transaction per file and the name index is
+        swapped at once.
+
+        The calls are background requests, so live polls always get their tokens first,
+        and pulls are skipped while less than min_budget of the daily budget is left.
+
+        Parameters:
+        - api_client (ApiClient): Shared API-Football client
+        - interval (int): Seconds between refreshes
+        - ttl (int): Age in seconds after which a league is downloaded again in full
+        - min_budget (float): Share of the daily API budget a pull needs to be left
+        """
+        self.api_client = api_client
+        self.interval = interval
+        self.ttl = ttl
+        self.min_budget = min_budget
+
+        # Set by start, the index loads in the background while the bot connects
+        self.teams_organizer = None
+        self.task = None
+        self.logger = configure_logging("index_refresher", "system")
+
+    def start(self, teams_organizer):
+        """
+        Starts the refresh loop, once.
+
+        Parameters:
+        - teams_organizer (TeamsOrganizer): Loaded index used by the commands
+        """
+        self.teams_organizer = teams_organizer
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def _run(self):
+        # The setup scripts download the files before a start, so restarts don't refresh right away
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Index refresh failed: {e}")
+
+    def has_budget(self):
+        """
+        Returns:
+        - bool: True if enough of the daily API budget is left for a pull
+        """
+        day_left = quota_governor.day_left()
+        if day_left < self.min_budget:
+            self.logger.info(f"Index refresh paused, {day_left:.0%} of the daily API budget left")
+            return False
+        return True
+
+    async def refresh(self):
+        """
+        Runs one refresh, stopping early when the daily API budget runs low.
+
+        Returns:
+        - bool: True if the index changed and was swapped
+        """
+        if not self.has_budget():
+            return False
+
+        leagues = await executor.run_io(read_leagues)
+
+        changed = False
+        for league_id, league in leagues.items():
+            if league["age"] > self.ttl:
+                # The other stale leagues are pulled by a later refresh
+                if not self.has_budget():
+                    break
+                changed |= await self.pull_league(league_id, league)
+
+        if self.has_budget():
+            changed |= await self.pull_window(leagues)
+
+        if not changed:
+            self.logger.info("Index refresh: no kickoff, team or postponement changes")
+            return False
+
+        # Imported in a worker thread, WAL lets commands keep reading the store meanwhile
+        self.teams_organizer.team_search = await executor.run_io(self.teams_organizer.reload)
+        self.logger.info("Index refreshed")
+        return True
+
+    async def pull_league(self, league_id, league):
+        """
+        Downloads the whole season of a league again, fixtures and standings.
+
+        Parameters:
+        - league_id (int): League id
+        - league (dict): Entry of read_leagues
+
+        Returns:
+        - bool: True if the index needs a rebuild
+        """
+        try:
+            fixtures = await self.api_client.get(
+                "/fixtures",
+                params={"league": league_id, "season": league["season"], "timezone": FIXTURES_TIMEZONE},
+                background=True,
+            )
+            standings = await self.api_client.get(
+                "/standings",
+                params={"league": league_id, "season": league["season"]},
+                background=True,
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error(f"Failed to refresh league {league['name']}: {e}")
+            return False
+
+        if not fixtures.get("response"):
+            return False
+
+        changed = self.diff_fixtures(league, fixtures["response"])
+        if changed:
+            await executor.run_io(write_json, league["path"], fixtures)
+        else:
+            # Restarts the TTL without touching the content
+            await executor.run_io(os.utime, league["path"])
+
+        if standings.get("response"):
+            standings_path = STANDINGS_PATH / os.path.basename(league["path"])
+            if await executor.run_io(self.standings_changed, standings_path, standings):
+                await executor.run_io(write_json, standings_path, standings)
+                changed = True
+
+        return changed
+
+    async def pull_window(self, leagues):
+        """
+        Downloads the fixtures of the days around today and merges those of tracked leagues.
+
+        The days are pulled by date, which finds games moved into the window. The games
+        the files have in the window are also pulled by id, which finds games moved out.
+
+        Parameters:
+        - leagues (dict): Result of read_leagues
+
+        Returns:
+        - bool: True if the index needs a rebuild
+        """
+        today = datetime.now().date()
+        dates = [today + timedelta(days=offset) for offset in range(-1, REFRESH_WINDOW_DAYS + 1)]
+
+        # {league_id: [fixture, ...]}
+        pulled = {}
+        for date in dates:
+            try:
+                fixtures = await self.api_client.get(
+                    "/fixtures",
+                    params={"date": date.isoformat(), "timezone": FIXTURES_TIMEZONE},
+                    background=True,
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.error(f"Failed to refresh the fixtures of {date}: {e}")
+                continue
+
+            for fixture in fixtures.get("response", []):
+                if fixture["league"]["id"] in leagues:
+                    pulled.setdefault(fixture["league"]["id"], []).append(fixture)
+
+        window_start = datetime.now(timezone.utc) - timedelta(days=1)
+        window_end = window_start + timedelta(days=REFRESH_WINDOW_DAYS + 2)
+        seen = {fixture["fixture"]["id"] for fixtures in pulled.values() for fixture in fixtures}
+        known_ids = [
+            fixture_id
+            for league in leagues.values()
+            for fixture_id, fixture in league["fixtures"].items()
+            if fixture_id not in seen and window_start <= get_index_key(fixture)[0] <= window_end
+        ]
+
+        for specific_fixture in (await get_fixtures_batch(known_ids, background=True)).values():
+            fixture = specific_fixture["response"][0]
+            pulled.setdefault(fixture["league"]["id"], []).append(fixture)
+
+        changed = False
+        for league_id, fixtures in pulled.items():
+            league = leagues[league_id]
+            if self.diff_fixtures(league, fixtures):
+                merged = {"response": list(league["fixtures"].values())}
+                await executor.run_io(write_json, league["path"], merged)
+                changed = True
+        return changed
+
+    def diff_fixtures(self, league, fixtures):
+        """
+        Merges pulled fixtures into a league, noting the changes the index cares about.
+
+        Parameters:
+        - league (dict): Entry of read_leagues, its "fixtures" are updated
+        - fixtures (list): Fixtures from the API
+
+        Returns:
+        - bool: True if a kickoff moved, a team changed, a game was postponed or a fixture was added
+        """
+        changed = False
+        for fixture in fixtures:
+            fixture_id = fixture["fixture"]["id"]
+            known = league["fixtures"].get(fixture_id)
+
+            if known is None:
+                self.logger.info(f"New fixture {fixture_id} in {league['name']}")
+                changed = True
+            elif get_index_key(known) != get_index_key(fixture):
+                self.logger.info(
+                    f"Fixture {fixture_id} in {league['name']} moved from "
+                    f"{known['fixture']['date']} ({known['fixture']['status']['short']}) to "
+                    f"{fixture['fixture']['date']} ({fixture['fixture']['status']['short']})"
+                )
+                changed = True
+
+            league["fixtures"][fixture_id] = fixture
+        return changed
+
+    @staticmethod
+    def standings_changed(standings_path, standings):
+        try:
+            with open(standings_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("response") != standings["response"]
+        except (OSError, ValueError):
+            return True
@@ -0,0 +1,84 @@
+import re
+import unicodedata
+from bisect import bisect_left
+
+# Discord shows at most 25 autocomplete choices
+MAX_CHOICES = 25
+
+# Letters NFKD leaves alone, folded by hand so "Bodø" also matches "Bodo"
+SPECIAL_LETTERS = str.maketrans({"ø": "o", "ł": "l", "đ": "d", "ð": "d", "þ": "th", "æ": "ae", "œ": "oe", "ı": "i"})
+
+# Dropped so "Nott'm" and "A.C." match "nottm" and "ac"
+JOINING_MARKS = re.compile(r"['.’]")
+# Any other punctuation separates words, "Saint-Germain" matches "saint g"
+SEPARATORS = re.compile(r"[\W_]+")
+
+
+def normalize(text):
+    """
+    Folds a team name or query for matching, without case and accents.
+
+    Parameters:
+    - text (str): Team name or user input
+
+    Returns:
+    - str: "Bayern München" -> "bayern munchen"
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    words = SEPARATORS.sub(" ", JOINING_MARKS.sub("", stripped.translate(SPECIAL_LETTERS)))
+    return words.lstrip()
+
+
+class TeamSearchIndex:
+    def __init__(self, team_names):
+        """
+        Sorted prefix index over the team names, for the /next_game autocomplete.
+
+        Parameters:
+        - team_names (list): Team names as shown to users
+        """
+        self.team_names = list(team_names)
+
+        # (normalized name, position), searched with bisect for name prefixes
+        self.names = sorted((normalize(name), position) for position, name in enumerate(self.team_names))
+
+        # (normalized name from a later word on, position), for mid-name matches such as "munchen"
+        self.tokens = sorted(
+            (key[index + 1:], position)
+            for key, position in self.names
+            for index, char in enumerate(key)
+            if char == " " and index + 1 < len(key)
+        )
+
+    def search(self, query, limit=MAX_CHOICES):
+        """
+        Finds the teams matching what the user typed so far.
+
+        Names starting with the query come first, then names with a later word
+        starting with it. Both groups are in alphabetical order, so an exact match
+        is always the first choice.
+
+        Parameters:
+        - query (str): User input
+        - limit (int): Maximum number of names returned
+
+        Returns:
+        - list: Matching team names
+        """
+        prefix = normalize(query or "")
+
+        results = []
+        seen = set()
+        for entries in (self.names, self.tokens):
+            index = bisect_left(entries, (prefix,))
+            while index < len(entries) and len(results) < limit:
+                key, position = entries[index]
+                if not key.startswith(prefix):
+                    break
+                if position not in seen:
+                    seen.add(position)
+                    results.append(self.team_names[position])
+                index += 1
+
+        return results
@@ -1,166 +1,49 @@
-import json
-from datetime import datetime, timezone, timedelta
-import os
-from configs.config import FIXTURES_PATH, STANDINGS_PATH, FIXTURES_BY_LEAGUE_PATH, INFORMATION_PATH, TEAMS_PATH
+from datetime import datetime, timezone
 from common_utils.time_logging import configure_logging
+from common_utils.fixture_store import fixture_store
+from bot.utils.team_search import TeamSearchIndex
+
+# Seconds after kickoff a game still counts as the next one, it can be followed while it's played
+NEXT_GAME_DELAY = 4 * 3600
+
+
+def to_epoch(moment):
+    """Accepts an aware datetime or Unix seconds, returns Unix seconds."""
+    if isinstance(moment, datetime):
+        return moment.timestamp()
+    return moment
+
 
 class TeamsOrganizer:
-    def __init__(self):
-        """
-        Initializes TeamsOrganizer with empty dictionaries for leagues, teams, and fixtures.
-        Loads team data on instantiation.
+    def __init__(self, store=fixture_store, logger=None):
         """
-        # Initialize the needed dicts
-        self.leagues = {}
-        self.teams_dict = {}
-        self.football_teams = []
-
-        self.teams_fixtures_dict = {}
-        self.fixtures_by_league  = {}  # New structure to hold fixtures by league
-        self.logger = configure_logging("teams_organizer", "system")
-        
-        self.load_fixtures()  # Load first since new_load_teams depends on it
-        self.new_load_teams()
-        
+        Team and fixture lookups for the commands, answered by the fixture store.
 
-    def load_fixtures(self):
-        """
-        Loads and organizes all fixture data from JSON files by league ID.
-        
-        Reads from ./Images_HelperFiles/AllFixtures directory.
-        Updates self.fixtures_by_league with structure:
-        {league_id: [fixture_data, ...]}
-        """
-        fixtures_path = FIXTURES_PATH
+        Only the autocomplete index of the team names is kept in memory, fixtures are
+        queried when a command needs them.
 
+        Parameters:
+        - store (FixtureStore): Store the setup files are imported into
+        - logger (Logger): Logger to reuse
         """
-        Load all fixtures from files and organize them by league ID.
-        """
-        for filename in os.listdir(fixtures_path):
-            file_path = os.path.join(fixtures_path, filename)
-            with open(file_path, 'r', encoding='utf-8') as league_fixtures_file:
-                fixtures = json.load(league_fixtures_file)
-                for fixture in fixtures.get("response", []):
-                    league_id = fixture["league"]["id"]
-                    if league_id not in self.fixtures_by_league:
-                        self.fixtures_by_league[league_id] = []
-                    self.fixtures_by_league[league_id].append(fixture)
-
-
-    def new_load_teams(self):
-        """
-        Processes team standings and matches them with fixtures.
-        
-        Reads from ./Images_HelperFiles/AllStandings directory.
-        Updates:
-        - self.teams_dict: {team_name: [team_id, league_id]}
-        - self.football_teams: [team_names]
-        - self.teams_fixtures_dict: {team_id: [{date, fixture_id}, ...]}
-        
-        Saves processed data to:
-        - fixtures_by_league.json
-        - information.json
-        - teams.json
+        self.store = store
+        self.logger = logger or configure_logging("teams_organizer", "system")
+
+        self.team_search = self.reload()
+
+    def reload(self):
         """
-        standings_path = STANDINGS_PATH
-        
-        
-        with open(
-            FIXTURES_BY_LEAGUE_PATH,
-            "w",
-            encoding="utf-8",
-        ) as f:
-            json.dump(self.fixtures_by_league, f, ensure_ascii=False, indent=4)
-        
-        
-        for filename in os.listdir(standings_path):
-            file_path = os.path.join(standings_path, filename)
-            with open(file_path, 'r', encoding='utf-8') as teams_file:
-                standings = json.load(teams_file)
-
-                if not standings.get("response"):
-                    continue
-
-                league_id = standings["response"][0]["league"]["id"]
-                for standing in standings["response"][0]["league"]["standings"]:
-                    for team in standing:
-                        team_id = team["team"]["id"]
-                        team_name = team["team"]["name"]
-                        
-                        '''Append teams to the teams list'''
-                        self.teams_dict[team_name] = [team_id, league_id]
-                        
-                        
-                        if team_name not in self.football_teams:
-                            self.football_teams.append(team_name)
-  
-                        self.teams_fixtures_dict[team_id] = []
-
-                        # Now, match teams with fixtures
-                        #for fixture in self.fixtures_by_league.get(league_id, []):
-                        for key_league_id in self.fixtures_by_league.keys():
-
-                            league = self.fixtures_by_league.get(key_league_id)
-                            
-                            for individual_fixture in league:
-                                    home_id = int(individual_fixture["teams"]["home"]["id"])
-                                    away_id = int(individual_fixture["teams"]["away"]["id"])             
-                                
-
-                                    if team_id in [home_id, away_id]:
-                                        self.logger.info(f"Team Found: {team_name}")
-                                        
-                                        fixture_id = int(individual_fixture["fixture"]["id"])
-                                        date = individual_fixture["fixture"]["date"]
-
-
-                                        # Parse the JSON date string into a datetime object
-                                        json_date = datetime.fromisoformat(
-                                            date.replace("Z", "+00:00")
-                                        )
-                                        current_date = datetime.now(timezone.utc)
-                                        # 5 Days Ago
-                                        five_days_ago = current_date - timedelta(days=5)
-
-                                        # Check if the game happened in the last two days or is scheduled for the future
-
-                                        if json_date > five_days_ago:  # two_days_agor
-
-                                            self.teams_fixtures_dict[team_id].append(
-                                                {
-                                                    "date": date,  # Use the formatted date
-                                                    "fixture_id": fixture_id,
-                                                }
-                                            )
-                  
-                  
-        for team_id in self.teams_fixtures_dict.keys():
-        
-            self.logger.info(f"Team Sorted: {team_id}")
-                        
-            self.teams_fixtures_dict[team_id] = sorted(
-            
-                    self.teams_fixtures_dict[team_id],
-                    key=lambda x: datetime.fromisoformat(x["date"]),
-                )       
-                     
-            
-        self.fixtures_by_league = None    
-        
-        with open(
-            INFORMATION_PATH,
-            "w",
-            encoding="utf-8",
-        ) as f:
-            json.dump(self.teams_fixtures_dict, f, ensure_ascii=False, indent=4)
+        Imports the fixture and standings files that changed, then rebuilds the name index.
 
-        with open(
-            TEAMS_PATH,
-            "w",
-            encoding="utf-8",
-        ) as f:
-            json.dump(self.teams_dict, f, ensure_ascii=False, indent=4)
+        Blocking, the index refresher runs it in a worker thread and swaps in the result.
 
+        Returns:
+        - TeamSearchIndex: Autocomplete index of the tracked teams
+        """
+        self.store.sync()
+        team_names = self.store.get_team_names()
+        self.logger.info(f"Teams loaded, {len(team_names)} teams")
+        return TeamSearchIndex(team_names)
 
     def new_find_next_fixture(self, team_league):
         """
@@ -173,9 +56,8 @@ class TeamsOrganizer:
         - tuple: (fixture_id, date) for the next game
         - None: if no fixtures found or team not found
         
-        Note: Uses UTC-4 timezone and includes 4-hour delay buffer
+        Note: Games that kicked off less than 4 hours ago still count as the next one
         """
-        """Find the team's next game."""
         '''team_league = [team_id, league_id];; Only need team_id in this new organization format'''
         if not team_league:
             self.logger.warning("Team or league not found.")
@@ -183,30 +65,45 @@ class TeamsOrganizer:
 
         team_id, league_id = team_league
 
-        team_fixtures = self.teams_fixtures_dict.get(team_id, [])
-        if not team_fixtures:
-            self.logger.warning("No fixtures found for this team or Team ID not found in the specified league.")
-            return None, None
-        
-        '''Add a loop  to iterate the list and grab the future game based on date, add 4 hours delay'''
-
-        # Current date in UTC and additional 4-hour delay
-        current_date_with_delay = datetime.now(timezone.utc) - timedelta(hours=4)
-
-        # Find next game
-        next_game = None
-        for fixture in team_fixtures:
-            fixture_date = datetime.fromisoformat(fixture["date"])
-            if fixture_date >= current_date_with_delay:
-                next_game = fixture
-                break
+        next_games = self.find_next_fixtures(team_id, 1)
         
         # Add null check before returning
-        if next_game is None:
+        if not next_games:
             self.logger.info("No future games found for this team.")
             return None, None
         
-        return next_game["fixture_id"], next_game["date"]
+        return next_games[0]
+
+    def find_next_fixtures(self, team_id, count, since=None):
+        """
+        Finds the next games of a team.
+
+        Parameters:
+        - team_id (int): Team id
+        - count (int): Maximum number of games returned
+        - since (datetime | int): Earliest kickoff, defaults to 4 hours ago
+
+        Returns:
+        - list: (fixture_id, date) tuples sorted by kickoff
+        """
+        if since is None:
+            since = datetime.now(timezone.utc).timestamp() - NEXT_GAME_DELAY
+
+        return self.store.get_team_fixtures(team_id, to_epoch(since), limit=count)
+
+    def find_fixtures_between(self, team_id, start, end):
+        """
+        Finds the games of a team kicking off in a time range.
+
+        Parameters:
+        - team_id (int): Team id
+        - start (datetime | int): Earliest kickoff, included
+        - end (datetime | int): Latest kickoff, included
+
+        Returns:
+        - list: (fixture_id, date) tuples sorted by kickoff
+        """
+        return self.store.get_team_fixtures(team_id, to_epoch(start), to_epoch(end))
 
     # Querying the data to grab the team fixture id
     def find_team_id(self, team_name):
@@ -223,6 +120,6 @@ class TeamsOrganizer:
         self.logger.debug(f"Looking up team ID for: {team_name}")
         """Find the team ID given the name input."""
         '''return [team_id , league_id]'''
-        # Directly return the result or 0 if not found
-        return self.teams_dict.get(team_name, [])
+        # Directly return the result or an empty list if not found
+        return self.store.find_team(team_name)
     
\ No newline at end of file
@@ -7,9 +7,9 @@ from configs.config import footer_text, footer_icon_url, embed_color, website_fi
 
 class CombinedView(discord.ui.View):
 
-    def __init__(self, task, author_id, task_manager, all_stats_dict):
+    def __init__(self, follow, author_id, task_manager, all_stats_dict):
         super().__init__(timeout=None)
-        self.task = task
+        self.follow = follow
         self.author_id = author_id
 
         self.fixture_json = 0
@@ -34,7 +34,7 @@ class CombinedView(discord.ui.View):
     async def end_task_button(self, button, interaction):
         
         """
-        Handles the "Stop Game" button interaction. Cancels the running task and updates game status.
+        Handles the "Stop Game" button interaction. Cancels the follow and updates game status.
 
         Parameters:
         - button: The button instance that triggered the interaction
@@ -51,8 +51,8 @@ class CombinedView(discord.ui.View):
             )
             return
 
-        # When button is pressed, cancel the task
-        self.task.cancel()
+        # When button is pressed, stop updating the game
+        self.follow.cancel()
         
         '''Use Data To retrieve Game Status'''
         game_status = self.fixture_json["response"][0]["fixture"]["status"]["short"]
@@ -0,0 +1,86 @@
+import asyncio
+import aiohttp
+
+from .quota_governor import quota_governor
+
+from configs.config import (
+    base_url,
+    headers,
+    API_TIMEOUT,
+    API_MAX_CONCURRENCY
+)
+
+class ApiClient:
+    def __init__(self, max_concurrency=API_MAX_CONCURRENCY, timeout=API_TIMEOUT):
+        """
+        Asynchronous API-Football client sharing one keep-alive connection pool.
+
+        Parameters:
+        - max_concurrency (int): Maximum number of requests in flight at once
+        - timeout (int): Seconds allowed for a whole request before it fails
+        """
+        self.max_concurrency = max_concurrency
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+
+        # Created lazily so they bind to the loop the bot runs in
+        self.session = None
+        self.semaphore = None
+
+    def get_session(self):
+        """
+        Returns the pooled session, opening it on first use.
+
+        Returns:
+        - aiohttp.ClientSession: Session with the API headers and timeout set
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                keepalive_timeout=60,
+            )
+            self.session = aiohttp.ClientSession(
+                headers=headers,
+                timeout=self.timeout,
+                connector=connector,
+            )
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.session
+
+    async def get(self, endpoint, params=None, background=False):
+        """
+        Sends a GET request to an API-Football endpoint.
+
+        Parameters:
+        - endpoint (str): Endpoint path, e.g. "/fixtures"
+        - params (dict): Query parameters
+        - background (bool): Low priority request, it waits for the live polls, see QuotaGovernor.acquire
+
+        Returns:
+        - dict: Decoded JSON response
+
+        Raises:
+        - aiohttp.ClientError: On connection errors or non 2xx responses
+        - asyncio.TimeoutError: If the request takes longer than the timeout
+        """
+        session = self.get_session()
+
+        # Every call counts against the plan quota, so wait for a token first
+        await quota_governor.acquire(background)
+
+        async with self.semaphore:
+            async with session.get(base_url + endpoint, params=params) as response:
+                if response.status == 429:
+                    quota_governor.exhaust_minute()
+                quota_governor.sync_from_headers(response.headers)
+                response.raise_for_status()
+                return await response.json()
+
+    async def close(self):
+        """Closes the pooled session and its connections."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+
+# Shared client used by every API-Football call in the bot process
+api_client = ApiClient()
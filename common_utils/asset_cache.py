@@ -0,0 +1,228 @@
+import asyncio
+import os
+
+import aiohttp
+
+from . import banner_formatter
+from .executor import executor
+from .time_logging import configure_logging
+from configs.config import (
+    API_TIMEOUT,
+    BANNERS_PATH,
+    LOGOS_PATH,
+    BANNER_STORE_MAX_MB,
+    BANNER_FORMAT
+)
+
+# Name the banner gets as a message attachment, embeds point at it with attachment://
+BANNER_ATTACHMENT = f"image.{BANNER_FORMAT}"
+
+
+def write_file(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Written under a temporary name so a half written logo is never used
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+def evict_banners(banners_path, max_bytes, keep):
+    """
+    Deletes the least recently used banners until the store fits its size cap.
+
+    Parameters:
+    - banners_path (Path): Banner directory
+    - max_bytes (int): Size cap of the directory
+    - keep (Path): Banner that is about to be sent, never deleted
+
+    Returns:
+    - int: Number of banners deleted
+    """
+    banners = []
+    total_size = 0
+    for entry in os.scandir(banners_path):
+        if entry.is_file() and entry.name.endswith((".png", ".webp")) and entry.path != str(keep):
+            stat = entry.stat()
+            banners.append((stat.st_mtime, stat.st_size, entry.path))
+            total_size += stat.st_size
+
+    deleted = 0
+    # Oldest use first, banners are touched every time they are served
+    for _, size, path in sorted(banners):
+        if total_size <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_size -= size
+        deleted += 1
+    return deleted
+
+
+class AssetCache:
+    def __init__(self, max_banner_bytes=BANNER_STORE_MAX_MB * 1024 * 1024, timeout=API_TIMEOUT, executor=executor):
+        """
+        Team logos cached on disk by team id, and a size capped store of the banners built from them.
+
+        Parameters:
+        - max_banner_bytes (int): Size cap of the banner directory
+        - timeout (int): Seconds allowed for a logo download
+        - executor (Executor): Pools the file writes and banner builds run in
+        """
+        self.max_banner_bytes = max_banner_bytes
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.executor = executor
+
+        # Created lazily so it binds to the loop the bot runs in
+        self.session = None
+        # {path: asyncio.Task} for downloads and banner builds still running
+        self.in_flight = {}
+
+        self.logger = configure_logging("asset_cache", "system")
+
+    def get_session(self):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(timeout=self.timeout)
+        return self.session
+
+    async def coalesce(self, path, factory):
+        """
+        Shares one running task between every caller waiting for the same file.
+
+        Parameters:
+        - path (Path): File being produced
+        - factory (callable): Returns the coroutine producing it
+
+        Returns:
+        - Path: The produced file
+        """
+        task = self.in_flight.get(path)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self.in_flight[path] = task
+            task.add_done_callback(lambda _: self.in_flight.pop(path, None))
+
+        # Shielded so one caller giving up does not cancel the work for the others
+        return await asyncio.shield(task)
+
+    async def get_logo(self, team_id, logo_url):
+        """
+        Returns the local copy of a team logo, downloading it the first time.
+
+        Parameters:
+        - team_id (int): Team id, used as the file name
+        - logo_url (str): Logo URL from the API response
+
+        Returns:
+        - Path: Logo file
+
+        Raises:
+        - aiohttp.ClientError, asyncio.TimeoutError: If the download fails
+        """
+        path = LOGOS_PATH / f"{team_id}.png"
+        if os.path.exists(path):
+            return path
+        return await self.coalesce(path, lambda: self._download(logo_url, path))
+
+    async def _download(self, url, path):
+        async with self.get_session().get(url) as response:
+            response.raise_for_status()
+            content = await response.read()
+
+        await self.executor.run_io(write_file, path, content)
+        self.logger.info(f"Logo saved: {path.name}")
+        return path
+
+    async def prefetch_logos(self, teams, max_concurrency=None):
+        """
+        Downloads the missing logos of several teams in parallel.
+
+        Parameters:
+        - teams (list): (team_id, logo_url) tuples
+        - max_concurrency (int): Maximum downloads at once, None for no limit
+        """
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def fetch(team_id, logo_url):
+            if semaphore is None:
+                return await self.get_logo(team_id, logo_url)
+            async with semaphore:
+                return await self.get_logo(team_id, logo_url)
+
+        results = await asyncio.gather(
+            *(fetch(team_id, logo_url) for team_id, logo_url in teams),
+            return_exceptions=True,
+        )
+        for (team_id, _), result in zip(teams, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to fetch the logo of team {team_id}: {result}")
+
+    def get_banner_path(self, specific_fixture):
+        """
+        Gets where the banner of a fixture is stored, whether or not it was built yet.
+
+        Banners are named after the team ids and the render version, so renamed
+        teams reuse their banner and names with odd characters never reach the path.
+
+        Parameters:
+        - specific_fixture (dict): Raw fixture API response holding a single fixture
+
+        Returns:
+        - Path: Banner file
+        """
+        teams = specific_fixture["response"][0]["teams"]
+        name = f"{teams['home']['id']}-{teams['away']['id']}-v{banner_formatter.RENDER_VERSION}"
+        return BANNERS_PATH / f"{name}.{BANNER_FORMAT}"
+
+    async def get_banner(self, specific_fixture):
+        """
+        Returns the banner of a fixture, building it from the cached logos if needed.
+
+        Parameters:
+        - specific_fixture (dict): Raw fixture API response holding a single fixture
+
+        Returns:
+        - Path: Banner file
+        """
+        teams = specific_fixture["response"][0]["teams"]
+
+        path = self.get_banner_path(specific_fixture)
+        if os.path.exists(path):
+            # Marks the banner as recently used for eviction
+            await self.executor.run_io(os.utime, path)
+            return path
+
+        return await self.coalesce(path, lambda: self._build_banner(teams, path))
+
+    async def _build_banner(self, teams, path):
+        home_logo, away_logo = await asyncio.gather(
+            self.get_logo(teams["home"]["id"], teams["home"]["logo"]),
+            self.get_logo(teams["away"]["id"], teams["away"]["logo"]),
+        )
+
+        await self.executor.run_cpu(
+            banner_formatter.combine_images,
+            home_logo,
+            banner_formatter.VS_IMAGE_PATH,
+            away_logo,
+            path,
+        )
+
+        deleted = await self.executor.run_io(evict_banners, BANNERS_PATH, self.max_banner_bytes, path)
+        if deleted:
+            self.logger.info(f"Evicted {deleted} banners to stay under {self.max_banner_bytes} bytes")
+
+        return path
+
+    async def close(self):
+        """Closes the logo download session."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+
+# Shared asset cache for the bot process
+asset_cache = AssetCache()
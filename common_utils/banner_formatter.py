@@ -1,9 +1,17 @@
-import requests
-from PIL import Image
-import io
+from functools import lru_cache
 import os
 import sys
 
+# PIL is imported by the functions below, so the bot process starts without it
+# and only the worker processes building banners load it
+
+# Decoded images kept per worker process, team logos are reused by every banner of a team
+IMAGE_CACHE_SIZE = 64
+# Part of every banner file name, bump it when the layout changes so old banners are rebuilt
+RENDER_VERSION = 2
+# Height of the banners, taller logos are scaled down to it
+BANNER_MAX_HEIGHT = 150
+
 def get_asset_path():
     """Get the correct path whether running as script or compiled"""
     if getattr(sys, 'frozen', False):
@@ -13,41 +21,72 @@ def get_asset_path():
         # Running in normal Python environment
         return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'images')
 
-def combine_images(home_logo, vs_image, away_logo, output_path, spacing=20):
+@lru_cache(maxsize=IMAGE_CACHE_SIZE)
+def load_image(path):
+    """
+    Decodes an image once, later calls get the cached copy.
+
+    Parameters:
+    - path (str): File path of the image
+
+    Returns:
+    - Image: Decoded image, callers must not modify it
+    """
+    from PIL import Image
+
+    image = Image.open(path)
+    image.load()
+    return image
+
+VS_IMAGE_PATH = os.path.join(get_asset_path(), 'vs.png')
+
+def save_banner(image, output_path):
+    """
+    Encodes a banner for upload, as WebP or palette PNG depending on the file extension.
+
+    Parameters:
+    - image (Image): RGBA banner
+    - output_path (str): File path, its extension picks the format
+    """
+    from PIL import Image
+
+    # Written under a temporary name so a half written banner is never uploaded,
+    # the pid keeps the bot and the prerender script apart when they build the same one
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    if str(output_path).endswith(".webp"):
+        image.save(temp_path, "WEBP", quality=90, method=4)
+    else:
+        # 256 colors are plenty for two crests, and make the file several times smaller
+        image.quantize(256, method=Image.Quantize.FASTOCTREE).save(temp_path, "PNG", optimize=True)
+    os.replace(temp_path, output_path)
+
+def combine_images(home_logo, vs_image, away_logo, output_path, spacing=20, max_height=BANNER_MAX_HEIGHT):
     """
     Combines three images (home team logo, versus image, and away team logo) into a single banner image.
     
     Parameters:
-    - home_logo: URL or file path of the home team's logo
-    - vs_image: File path of the 'versus' image to place between logos
-    - away_logo: URL or file path of the away team's logo 
-    - output_path: File path where the combined banner should be saved
+    - home_logo: File path of the home team's logo, see asset_cache.get_logo
+    - vs_image: File path of the 'versus' image to place between logos, e.g. VS_IMAGE_PATH
+    - away_logo: File path of the away team's logo 
+    - output_path: File path where the combined banner should be saved, .png or .webp
     - spacing: Pixels of horizontal space between images (default: 20)
+    - max_height: Height cap of the banner in pixels (default: BANNER_MAX_HEIGHT)
 
     Returns:
     - None. Saves the combined image to the specified output path.
     """
-    # Get the vs.png path
-    vs_image_path = os.path.join(get_asset_path(), 'vs.png')
-    
-    # Open images
-    # image1 = Image.open(home_logo)
-
-    response1 = requests.get(home_logo)
-    image1 = Image.open(io.BytesIO(response1.content))
+    from PIL import Image
 
-    image2 = Image.open(vs_image_path)
-
-    # image3 = Image.open(away_logo)
-
-    response3 = requests.get(away_logo)
-    image3 = Image.open(io.BytesIO(response3.content))
+    # Open images
+    image1 = load_image(str(home_logo))
+    image2 = load_image(str(vs_image))
+    image3 = load_image(str(away_logo))
 
     # Resize images to have the same height
-    min_height = min(image1.height, image2.height, image3.height)
-    image1 = image1.resize((int(image1.width * min_height / image1.height), min_height))
-    image2 = image2.resize((int(image2.width * min_height / image2.height), min_height))
-    image3 = image3.resize((int(image3.width * min_height / image3.height), min_height))
+    min_height = min(image1.height, image2.height, image3.height, max_height)
+    image1 = image1.convert("RGBA").resize((int(image1.width * min_height / image1.height), min_height), Image.LANCZOS)
+    image2 = image2.convert("RGBA").resize((int(image2.width * min_height / image2.height), min_height), Image.LANCZOS)
+    image3 = image3.convert("RGBA").resize((int(image3.width * min_height / image3.height), min_height), Image.LANCZOS)
 
     # Create a new blank image with the combined width and the height of the tallest image
     combined_width = image1.width + image2.width + image3.width + (2 * spacing)
@@ -62,5 +101,5 @@ def combine_images(home_logo, vs_image, away_logo, output_path, spacing=20):
     combined_image.paste(image3, (image1.width + image2.width + (2 * spacing), 0))
 
     # Save the combined image
-    combined_image.save(output_path)
+    save_banner(combined_image, output_path)
 
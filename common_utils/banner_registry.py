@@ -0,0 +1,84 @@
+import time
+from urllib.parse import urlparse, parse_qs
+
+# Attachment URLs are dropped this many seconds before Discord expires them
+REFRESH_MARGIN = 3600
+
+
+def get_url_expiry(url):
+    """
+    Reads when a Discord attachment URL stops working.
+
+    Parameters:
+    - url (str): Attachment CDN URL, signed with an "ex" query parameter
+
+    Returns:
+    - int: Unix time the URL expires, None if it isn't signed
+    """
+    expiry = parse_qs(urlparse(url).query).get("ex")
+    if not expiry:
+        return None
+    try:
+        return int(expiry[0], 16)
+    except ValueError:
+        return None
+
+
+class BannerRegistry:
+    def __init__(self, refresh_margin=REFRESH_MARGIN):
+        """
+        Remembers the CDN URL of every banner already uploaded to Discord, so embeds
+        can reference it instead of attaching the same PNG again.
+
+        Parameters:
+        - refresh_margin (int): Seconds before expiry a URL stops being handed out
+        """
+        self.refresh_margin = refresh_margin
+
+        # {banner path: (url, expires_at)}
+        self.urls = {}
+
+    def get_url(self, banner_path):
+        """
+        Gets the uploaded URL of a banner.
+
+        Parameters:
+        - banner_path (Path): Local banner file
+
+        Returns:
+        - str: CDN URL, None if the banner has to be uploaded (again)
+        """
+        entry = self.urls.get(str(banner_path))
+        if entry is None:
+            return None
+
+        url, expires_at = entry
+        if expires_at is not None and time.time() > expires_at - self.refresh_margin:
+            del self.urls[str(banner_path)]
+            return None
+        return url
+
+    def record(self, banner_path, url):
+        """
+        Saves the CDN URL a banner got when it was uploaded.
+
+        Parameters:
+        - banner_path (Path): Local banner file
+        - url (str): Attachment URL returned by Discord
+        """
+        self.urls[str(banner_path)] = (url, get_url_expiry(url))
+
+    def record_message(self, banner_path, message):
+        """
+        Saves the banner URL from a message sent with the banner attached.
+
+        Parameters:
+        - banner_path (Path): Local banner file
+        - message (discord.Message): Message holding the banner as its attachment
+        """
+        if message is not None and message.attachments:
+            self.record(banner_path, message.attachments[0].url)
+
+
+# Shared registry for the bot process
+banner_registry = BannerRegistry()
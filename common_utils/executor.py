@@ -0,0 +1,92 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from configs.config import CPU_WORKERS
+
+# Threads for blocking file I/O, which spends its time waiting rather than computing
+IO_WORKERS = 4
+
+
+class Executor:
+    def __init__(self, io_workers=IO_WORKERS, cpu_workers=CPU_WORKERS):
+        """
+        Runs blocking work away from the event loop.
+
+        File I/O goes to a thread pool, CPU heavy work such as image processing
+        goes to a process pool so it doesn't hold the GIL the loop needs.
+
+        Parameters:
+        - io_workers (int): Threads for file I/O
+        - cpu_workers (int): Processes for CPU bound work
+        """
+        self.io_workers = io_workers
+        self.cpu_workers = cpu_workers
+
+        # Created on first use so scripts that never offload don't start workers
+        self.thread_pool = None
+        self.process_pool = None
+
+    def get_thread_pool(self):
+        if self.thread_pool is None:
+            self.thread_pool = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="io_worker")
+        return self.thread_pool
+
+    def get_process_pool(self):
+        if self.process_pool is None:
+            self.process_pool = ProcessPoolExecutor(max_workers=self.cpu_workers)
+        return self.process_pool
+
+    async def run_io(self, func, *args, **kwargs):
+        """
+        Runs a blocking I/O call in the thread pool.
+
+        Parameters:
+        - func (callable): Function to call
+        - args, kwargs: Its arguments
+
+        Returns:
+        - The return value of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.get_thread_pool(), functools.partial(func, *args, **kwargs))
+
+    def submit_io(self, func, *args, **kwargs):
+        """
+        Starts a blocking call in the thread pool without waiting, also before the event loop runs.
+
+        Parameters:
+        - func (callable): Function to call
+        - args, kwargs: Its arguments
+
+        Returns:
+        - concurrent.futures.Future: Awaitable from the loop with asyncio.wrap_future
+        """
+        return self.get_thread_pool().submit(func, *args, **kwargs)
+
+    async def run_cpu(self, func, *args, **kwargs):
+        """
+        Runs a CPU bound call in the process pool.
+
+        Parameters:
+        - func (callable): Module level function to call, it and its arguments must be picklable
+        - args, kwargs: Its arguments
+
+        Returns:
+        - The return value of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.get_process_pool(), functools.partial(func, *args, **kwargs))
+
+    def shutdown(self):
+        """Waits for running work and stops the pools."""
+        if self.thread_pool is not None:
+            self.thread_pool.shutdown(wait=True)
+            self.thread_pool = None
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=True)
+            self.process_pool = None
+
+
+# Shared pools for the bot process
+executor = Executor()
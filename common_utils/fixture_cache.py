@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+from .api_client import api_client
+from configs.config import FIXTURE_CACHE_TTL
+
+class FixtureCache:
+    def __init__(self, ttl=FIXTURE_CACHE_TTL):
+        """
+        Short lived cache of /fixtures?id= responses with request coalescing.
+
+        Parameters:
+        - ttl (int): Seconds a stored response is served before it is fetched again
+        """
+        self.ttl = ttl
+
+        # {fixture_id: (stored_at, fixture response)}
+        self.entries = {}
+        # {fixture_id: asyncio.Task} for fetches still running
+        self.in_flight = {}
+
+    def get_fresh(self, fixture_id):
+        """
+        Returns the stored response for a fixture if it is younger than the TTL.
+
+        Parameters:
+        - fixture_id (int): The unique identifier for the fixture
+
+        Returns:
+        - dict: Fixture response, or None if missing or expired
+        """
+        entry = self.entries.get(fixture_id)
+        if entry is None:
+            return None
+
+        stored_at, specific_fixture = entry
+        if time.monotonic() - stored_at > self.ttl:
+            return None
+        return specific_fixture
+
+    def store(self, fixture_id, specific_fixture):
+        """
+        Saves a fixture response fetched elsewhere, e.g. by the batched poller.
+
+        Parameters:
+        - fixture_id (int): The unique identifier for the fixture
+        - specific_fixture (dict): Fixture response holding that single fixture
+        """
+        now = time.monotonic()
+
+        # Drop expired responses so the cache only holds recently used fixtures
+        expired = [key for key, (stored_at, _) in self.entries.items() if now - stored_at > self.ttl]
+        for key in expired:
+            del self.entries[key]
+
+        self.entries[fixture_id] = (now, specific_fixture)
+
+    async def get(self, fixture_id):
+        """
+        Returns a fixture response, sharing one request between concurrent callers.
+
+        Parameters:
+        - fixture_id (int): The unique identifier for the fixture
+
+        Returns:
+        - dict: Fixture response as returned by /fixtures?id=
+
+        Raises:
+        - aiohttp.ClientError, asyncio.TimeoutError: If the request fails
+        """
+        specific_fixture = self.get_fresh(fixture_id)
+        if specific_fixture is not None:
+            return specific_fixture
+
+        task = self.in_flight.get(fixture_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(fixture_id))
+            self.in_flight[fixture_id] = task
+            task.add_done_callback(lambda _: self.in_flight.pop(fixture_id, None))
+
+        # Shielded so one caller giving up does not cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def _fetch(self, fixture_id):
+        params = {"id": fixture_id, 'timezone' : "Europe/London"}
+        specific_fixture = await api_client.get("/fixtures", params=params)
+        self.store(fixture_id, specific_fixture)
+        return specific_fixture
+
+
+# Shared cache for every fixture lookup in the bot process
+fixture_cache = FixtureCache()
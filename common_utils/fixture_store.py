@@ -0,0 +1,313 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from .time_logging import configure_logging
+from configs.config import FIXTURE_STORE_PATH, FIXTURES_PATH, STANDINGS_PATH
+
+# Bump when the tables change, the store is then rebuilt from the JSON files
+SCHEMA_VERSION = 2
+
+# Short statuses of games that won't be played at their date, left out of the next game lookups
+INACTIVE_STATUSES = ("PST", "CANC", "ABD")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    league_id INTEGER,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha1 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS leagues (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    season INTEGER
+);
+CREATE TABLE IF NOT EXISTS teams (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS standings (
+    league_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    rank INTEGER,
+    points INTEGER,
+    PRIMARY KEY (league_id, team_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS fixtures (
+    id INTEGER PRIMARY KEY,
+    league_id INTEGER NOT NULL,
+    kickoff INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    home_id INTEGER NOT NULL,
+    away_id INTEGER NOT NULL,
+    status TEXT
+);
+-- One row per team and fixture, so a team's games are one index range
+CREATE TABLE IF NOT EXISTS team_fixtures (
+    team_id INTEGER NOT NULL,
+    kickoff INTEGER NOT NULL,
+    fixture_id INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    status TEXT,
+    PRIMARY KEY (team_id, kickoff, fixture_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS fixtures_league_kickoff ON fixtures (league_id, kickoff);
+CREATE INDEX IF NOT EXISTS team_fixtures_fixture ON team_fixtures (fixture_id);
+CREATE INDEX IF NOT EXISTS teams_name ON teams (name);
+CREATE INDEX IF NOT EXISTS standings_team ON standings (team_id);
+"""
+
+
+def hash_file(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class FixtureStore:
+    def __init__(self, path=FIXTURE_STORE_PATH):
+        """
+        SQLite store of the leagues, teams, standings and fixtures downloaded by the setup scripts.
+
+        The JSON files in AllFixtures and AllStandings stay the download format, sync()
+        imports the ones that changed. WAL mode lets the bot, the GUI and the setup
+        scripts read while one of them writes.
+
+        Parameters:
+        - path (Path): Database file
+        """
+        self.path = path
+        # sqlite3 connections can't be shared between threads, and sync runs in a worker thread
+        self.local = threading.local()
+        self.logger = configure_logging("fixture_store", "system")
+
+    def get_connection(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(str(self.path), timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+
+            if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                with connection:
+                    for (table,) in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall():
+                        connection.execute(f"DROP TABLE {table}")
+                    connection.executescript(SCHEMA)
+                    connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+            self.local.connection = connection
+        return connection
+
+    def sync(self, fixtures_path=FIXTURES_PATH, standings_path=STANDINGS_PATH):
+        """
+        Imports the fixture and standings files that changed since the last sync.
+
+        A file whose mtime or size moved is hashed, so files rewritten with the same
+        content (e.g. by the daily setup scripts) are not imported again. Blocking,
+        run it from a worker thread inside the bot.
+
+        Parameters:
+        - fixtures_path (Path): AllFixtures directory
+        - standings_path (Path): AllStandings directory
+
+        Returns:
+        - int: Number of files imported or removed
+        """
+        connection = self.get_connection()
+        recorded = {
+            path: (mtime_ns, size, sha1, kind, league_id)
+            for path, kind, league_id, mtime_ns, size, sha1 in connection.execute("SELECT * FROM sources")
+        }
+
+        changes = 0
+        found = set()
+        for kind, directory in (("fixtures", fixtures_path), ("standings", standings_path)):
+            import_file = self.import_fixtures if kind == "fixtures" else self.import_standings
+            for entry in os.scandir(directory):
+                if not entry.is_file():
+                    continue
+
+                stat = entry.stat()
+                found.add(entry.path)
+                previous = recorded.get(entry.path)
+                if previous is not None and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+                    continue
+
+                sha1 = hash_file(entry.path)
+                with connection:
+                    if previous is None or previous[2] != sha1:
+                        league_id = import_file(connection, entry.path)
+                        changes += 1
+                    else:
+                        # Same content, only the mtime moved
+                        league_id = previous[4]
+                    connection.execute(
+                        "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?, ?)",
+                        (entry.path, kind, league_id, stat.st_mtime_ns, stat.st_size, sha1),
+                    )
+
+        for path in recorded.keys() - found:
+            _, _, _, kind, league_id = recorded[path]
+            with connection:
+                self.remove_source(connection, path, kind, league_id)
+            changes += 1
+
+        if changes:
+            self.logger.info(f"Fixture store synced, {changes} files imported or removed")
+        return changes
+
+    def import_fixtures(self, connection, path):
+        """
+        Replaces the fixtures of a league with the content of its fixtures file.
+
+        Returns:
+        - int: League id, None if the file holds no fixtures
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            fixtures = json.load(f).get("response", [])
+        if not fixtures:
+            return None
+
+        league = fixtures[0]["league"]
+        self.delete_fixtures(connection, league["id"])
+        connection.execute(
+            "INSERT OR REPLACE INTO leagues VALUES (?, ?, ?)",
+            (league["id"], league["name"], league.get("season")),
+        )
+
+        rows = []
+        team_rows = []
+        for fixture in fixtures:
+            date = fixture["fixture"]["date"]
+            kickoff = int(datetime.fromisoformat(date).timestamp())
+            fixture_id = int(fixture["fixture"]["id"])
+            home_id = int(fixture["teams"]["home"]["id"])
+            away_id = int(fixture["teams"]["away"]["id"])
+            status = fixture["fixture"].get("status", {}).get("short")
+
+            rows.append((fixture_id, league["id"], kickoff, date, home_id, away_id, status))
+            team_rows.append((home_id, kickoff, fixture_id, date, status))
+            team_rows.append((away_id, kickoff, fixture_id, date, status))
+
+        connection.executemany("INSERT OR REPLACE INTO fixtures VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        connection.executemany("INSERT OR REPLACE INTO team_fixtures VALUES (?, ?, ?, ?, ?)", team_rows)
+        return league["id"]
+
+    def import_standings(self, connection, path):
+        """
+        Replaces the standings of a league with the content of its standings file.
+
+        Returns:
+        - int: League id, None if the file holds no standings
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            standings = json.load(f).get("response")
+        if not standings:
+            return None
+
+        league = standings[0]["league"]
+        connection.execute("DELETE FROM standings WHERE league_id = ?", (league["id"],))
+
+        for standing in league["standings"]:
+            for team in standing:
+                connection.execute(
+                    "INSERT OR REPLACE INTO teams VALUES (?, ?)",
+                    (team["team"]["id"], team["team"]["name"]),
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO standings VALUES (?, ?, ?, ?)",
+                    (league["id"], team["team"]["id"], team.get("rank"), team.get("points")),
+                )
+        return league["id"]
+
+    def delete_fixtures(self, connection, league_id):
+        connection.execute(
+            "DELETE FROM team_fixtures WHERE fixture_id IN (SELECT id FROM fixtures WHERE league_id = ?)",
+            (league_id,),
+        )
+        connection.execute("DELETE FROM fixtures WHERE league_id = ?", (league_id,))
+
+    def remove_source(self, connection, path, kind, league_id):
+        """Drops the rows imported from a file that was deleted."""
+        if league_id is not None:
+            if kind == "standings":
+                connection.execute("DELETE FROM standings WHERE league_id = ?", (league_id,))
+            else:
+                self.delete_fixtures(connection, league_id)
+        connection.execute("DELETE FROM sources WHERE path = ?", (path,))
+
+    def get_team_names(self):
+        """
+        Returns:
+        - list: Names of the teams in the standings of any tracked league
+        """
+        return [
+            name for (name,) in self.get_connection().execute(
+                "SELECT name FROM teams WHERE id IN (SELECT team_id FROM standings) ORDER BY name"
+            )
+        ]
+
+    def find_team(self, team_name):
+        """
+        Parameters:
+        - team_name (str): Team name as shown to users
+
+        Returns:
+        - list: [team_id, league_id], empty if no tracked team has that name
+        """
+        row = self.get_connection().execute(
+            "SELECT teams.id, standings.league_id FROM teams JOIN standings ON standings.team_id = teams.id "
+            "WHERE teams.name = ? LIMIT 1",
+            (team_name,),
+        ).fetchone()
+        return list(row) if row else []
+
+    def get_team_fixtures(self, team_id, start, end=None, limit=-1):
+        """
+        Reads a team's games from one range of the (team_id, kickoff) index.
+
+        Postponed, cancelled and abandoned games are left out, see INACTIVE_STATUSES.
+
+        Parameters:
+        - team_id (int): Team id
+        - start (float): Earliest kickoff in Unix seconds, included
+        - end (float): Latest kickoff in Unix seconds, included, None for no limit
+        - limit (int): Maximum number of games, -1 for no limit
+
+        Returns:
+        - list: (fixture_id, date) tuples sorted by kickoff
+        """
+        placeholders = ", ".join("?" * len(INACTIVE_STATUSES))
+        return self.get_connection().execute(
+            "SELECT fixture_id, date FROM team_fixtures WHERE team_id = ? AND kickoff >= ? AND kickoff <= ? "
+            f"AND (status IS NULL OR status NOT IN ({placeholders})) ORDER BY kickoff LIMIT ?",
+            (team_id, start, end if end is not None else 2 ** 62, *INACTIVE_STATUSES, limit),
+        ).fetchall()
+
+    def get_league_fixtures(self, league_id, start, end):
+        """
+        Parameters:
+        - league_id (int): League id
+        - start (float): Earliest kickoff in Unix seconds, included
+        - end (float): Latest kickoff in Unix seconds, included
+
+        Returns:
+        - list: (fixture_id, date, home_id, away_id) tuples sorted by kickoff
+        """
+        return self.get_connection().execute(
+            "SELECT id, date, home_id, away_id FROM fixtures WHERE league_id = ? AND kickoff BETWEEN ? AND ? "
+            "ORDER BY kickoff",
+            (league_id, start, end),
+        ).fetchall()
+
+    def count_teams(self):
+        return self.get_connection().execute("SELECT COUNT(DISTINCT team_id) FROM standings").fetchone()[0]
+
+
+# Shared store for the process, connections are opened per thread on first use
+fixture_store = FixtureStore()
@@ -1,23 +1,25 @@
-import requests
+import asyncio
+import aiohttp
 import logging
-import os
 import discord
 from datetime import datetime
-from . import banner_formatter
+from .api_client import api_client
+from .fixture_cache import fixture_cache
+from .executor import executor
+from .asset_cache import asset_cache, BANNER_ATTACHMENT
 from configs.config import (
     footer_icon_url, 
     embed_color, 
     website_name,
     website_url,
     website_field_name,
-    base_url,
-    headers,
-    VS_PATH,
-    BANNERS_PATH,
     footer_text
 )
 
-def get_team_names_from_fixture(fixture_id):
+# API-Football accepts at most 20 ids in a single /fixtures?ids= call
+MAX_FIXTURES_PER_REQUEST = 20
+
+async def get_team_names_from_fixture(fixture_id):
     """
     Retrieves the names of the home and away teams for a specific fixture.
 
@@ -28,23 +30,71 @@ def get_team_names_from_fixture(fixture_id):
     - tuple: (home_team_name, away_team_name)
     """
     try:
-        response = requests.get(
-            f"{base_url}/fixtures", headers=headers, params={"id": fixture_id}
-        )
-        response.raise_for_status()
-        fixture_data = response.json()
+        fixture_data = await fixture_cache.get(fixture_id)
 
         #print("\n\n", fixture_data)
 
         home_team_name = fixture_data["response"][0]["teams"]["home"]["name"]
         away_team_name = fixture_data["response"][0]["teams"]["away"]["name"]
         return home_team_name, away_team_name
-    except requests.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         logging.error(f"Failed to fetch team names for fixture ID {fixture_id}: {e}")
         return None, None  # Consider how you want to handle errors in your application
 
 
-def get_thread_embed(fixture_id, usage_type=0):
+async def get_fixtures_batch(fixture_ids, background=False):
+    """
+    Fetches several fixtures using the fewest /fixtures?ids= calls possible.
+
+    Parameters:
+    - fixture_ids (list): Unique identifiers of the fixtures.
+    - background (bool): Low priority fetch, see ApiClient.get
+
+    Returns:
+    - dict: {fixture_id: fixture response holding only that fixture}
+      Fixtures whose request failed are left out.
+    """
+    fixtures = {}
+
+    # Fixtures looked up moments ago, e.g. by /follow, are served from the cache
+    for fixture_id in fixture_ids:
+        specific_fixture = fixture_cache.get_fresh(fixture_id)
+        if specific_fixture is not None:
+            fixtures[fixture_id] = specific_fixture
+
+    fixture_ids = [fixture_id for fixture_id in dict.fromkeys(fixture_ids) if fixture_id not in fixtures]
+    chunks = [
+        fixture_ids[i:i + MAX_FIXTURES_PER_REQUEST]
+        for i in range(0, len(fixture_ids), MAX_FIXTURES_PER_REQUEST)
+    ]
+
+    responses = await asyncio.gather(
+        *[
+            api_client.get(
+                "/fixtures",
+                params={"ids": "-".join(str(fixture_id) for fixture_id in chunk), 'timezone' : "Europe/London"},
+                background=background,
+            )
+            for chunk in chunks
+        ],
+        return_exceptions=True,
+    )
+
+    for chunk, fixtures_data in zip(chunks, responses):
+        if isinstance(fixtures_data, Exception):
+            logging.error(f"Failed to fetch fixtures {chunk}: {fixtures_data}")
+            continue
+
+        # Split the response back out so each fixture looks like a single ?id= call
+        for item in fixtures_data.get("response", []):
+            fixture_id = int(item["fixture"]["id"])
+            fixtures[fixture_id] = {"response": [item]}
+            fixture_cache.store(fixture_id, fixtures[fixture_id])
+
+    return fixtures
+
+
+async def get_thread_embed(fixture_id, usage_type=0):
     """
     Fetches data for a specific fixture by its ID from the football API.
 
@@ -57,37 +107,20 @@ def get_thread_embed(fixture_id, usage_type=0):
     """
 
 
-    params = {"id": fixture_id, 'timezone' : "Europe/London"}
-    fixtures_url = base_url + "/fixtures"
-    response = requests.get(fixtures_url, headers=headers, params=params)
-
-    specific_fixture = response.json()
+    specific_fixture = await fixture_cache.get(fixture_id)
 
-    home_team_logo = specific_fixture["response"][0]["teams"]["home"]["logo"]
-    away_team_logo = specific_fixture["response"][0]["teams"]["away"]["logo"]
     league_image = specific_fixture["response"][0]["league"]["logo"]
 
     home_team = str(specific_fixture["response"][0]["teams"]["home"]["name"])
     away_team = str(specific_fixture["response"][0]["teams"]["away"]["name"])
 
-    vs = str(VS_PATH)
-
-    # Replace hardcoded banner path
-    file_path = BANNERS_PATH / f"{home_team}vs{away_team}.png"
-
-    # Check if the file already exists
-    if not os.path.exists(file_path):
-        # The file does not exist, so you can run your code to create the banner
-        banner_formatter.combine_images(
-            home_team_logo,
-            vs,
-            away_team_logo,
-            file_path,
-        )
+    # Built from the cached team logos the first time the game is shown
+    file_path = await asset_cache.get_banner(specific_fixture)
 
-    file = discord.File(
+    file = await executor.run_io(
+        discord.File,
         str(file_path),  # Convert Path to string for discord.File
-        filename="image.png",
+        filename=BANNER_ATTACHMENT,
     )
 
     date = str(specific_fixture["response"][0]["fixture"]["date"])
@@ -117,7 +150,7 @@ def get_thread_embed(fixture_id, usage_type=0):
     # Set the image of the embed
     # Load your local image
     # Set the image in the embed to reference the uploaded file by using `attachment://filename`
-    embed.set_image(url="attachment://image.png")
+    embed.set_image(url=f"attachment://{BANNER_ATTACHMENT}")
 
     # Set the thumbnail of the embed
     embed.set_thumbnail(url=league_image)
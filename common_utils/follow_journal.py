@@ -0,0 +1,158 @@
+import asyncio
+import json
+import os
+
+from .time_logging import configure_logging
+from .executor import executor
+from configs.config import FOLLOW_JOURNAL_PATH
+
+# Seconds journal records are buffered before they are written and synced together
+JOURNAL_FLUSH_INTERVAL = 1
+
+
+class FollowJournal:
+    def __init__(self, path=FOLLOW_JOURNAL_PATH, flush_interval=JOURNAL_FLUSH_INTERVAL):
+        """
+        Append-only JSONL journal of the running follows, so they survive a restart.
+
+        Each line is either {"op": "follow", ...} holding the whole state of a follow,
+        or {"op": "end", "message_id": ...} once it stopped. Replaying the lines in
+        order gives the follows still running.
+
+        Parameters:
+        - path (Path): Journal file
+        - flush_interval (int): Seconds records are buffered before one write and fsync
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+
+        # Lines waiting for the next flush
+        self.pending = []
+        self.task = None
+        self.logger = configure_logging("follow_journal", "system")
+
+    def load(self):
+        """
+        Replays the journal and compacts it down to the follows still running.
+
+        Returns:
+        - dict: {message_id: follow record}
+        """
+        follows = {}
+
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A crash can leave the last line half written
+                        self.logger.warning(f"Skipping unreadable journal line: {line!r}")
+                        continue
+
+                    if record["op"] == "follow":
+                        follows[record["message_id"]] = record
+                    elif record["op"] == "end":
+                        follows.pop(record["message_id"], None)
+
+        self.compact(follows)
+        return follows
+
+    def compact(self, follows):
+        """
+        Rewrites the journal with one line per running follow.
+
+        Parameters:
+        - follows (dict): {message_id: follow record}
+        """
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for record in follows.values():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Atomic, so a crash leaves either the old or the new journal
+        os.replace(temp_path, self.path)
+
+    def record_follow(self, follow):
+        """
+        Saves the current state of a follow, replacing what was saved before.
+
+        Parameters:
+        - follow (MatchFollow): Follow to save
+        """
+        self.append({
+            "op": "follow",
+            "message_id": follow.message.id,
+            "channel_id": follow.message.channel.id,
+            "fixture_id": follow.fixture_id,
+            "author_id": follow.author_id,
+            "announcement_id": follow.announcement_id,
+            "game_name": follow.game_name,
+            "phase": follow.phase,
+            # Cursor of the events already announced
+            "events": None if follow.announced_events is None else [list(key) for key in follow.announced_events],
+        })
+
+    def record_end(self, follow):
+        """
+        Marks a follow as stopped.
+
+        Parameters:
+        - follow (MatchFollow): Follow that stopped
+        """
+        self.append({"op": "end", "message_id": follow.message.id})
+
+    def record_dropped(self, message_id):
+        """
+        Marks a follow that can't be resumed as stopped, e.g. once its channel was deleted.
+
+        Parameters:
+        - message_id (int): Message of the follow
+        """
+        self.append({"op": "end", "message_id": message_id})
+
+    def append(self, record):
+        self.pending.append(json.dumps(record, ensure_ascii=False) + "\n")
+
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+
+        # Records added during a write go out with the next one
+        while self.pending:
+            lines, self.pending = self.pending, []
+            await executor.run_io(self.write_lines, lines)
+
+    def flush(self):
+        """Writes the buffered records and syncs them to disk, e.g. on shutdown."""
+        if not self.pending:
+            return
+
+        lines, self.pending = self.pending, []
+        self.write_lines(lines)
+
+    def write_lines(self, lines):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def load_event_cursor(events):
+    """
+    Converts the journal event cursor back to event keys.
+
+    Parameters:
+    - events (list): "events" of a follow record, None if it was unknown
+
+    Returns:
+    - list: Event keys as produced by event_key, None for a cursor written in the
+      older [identity, occurrence] format, which can't be converted
+    """
+    if events is None or any(len(key) == 2 for key in events):
+        return None
+    return [tuple(key) for key in events]
@@ -0,0 +1,231 @@
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from configs.config import API_PLAN, API_PLAN_LIMITS
+
+# Share of both buckets background requests leave for the live polls
+BACKGROUND_RESERVE = 0.5
+# Seconds a background request waits while live polls are queued for a token
+BACKGROUND_RETRY = 1
+
+class TokenBucket:
+    def __init__(self, capacity, period):
+        """
+        Token bucket refilled continuously at capacity tokens per period.
+
+        Parameters:
+        - capacity (int): Maximum number of tokens held
+        - period (int): Seconds needed to refill an empty bucket
+        """
+        self.capacity = capacity
+        self.refill_rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+
+    def wait_time(self, reserve=0):
+        """
+        Parameters:
+        - reserve (float): Share of the capacity that must stay in the bucket after the token is taken
+
+        Returns:
+        - float: Seconds until one token is available, 0 if one is available now
+        """
+        self.refill()
+        needed = 1 + reserve * self.capacity
+        if self.tokens >= needed:
+            return 0
+        return (needed - self.tokens) / self.refill_rate
+
+    def fill_ratio(self):
+        """
+        Returns:
+        - float: Share of the bucket still available, between 0 and 1
+        """
+        self.refill()
+        return self.tokens / self.capacity
+
+
+class DailyQuota:
+    def __init__(self, capacity):
+        """
+        Daily request quota, refilled all at once at 00:00 UTC like the API-Football one.
+
+        Parameters:
+        - capacity (int): Requests allowed per UTC day
+        """
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.day = datetime.now(timezone.utc).date()
+
+    def refill(self):
+        today = datetime.now(timezone.utc).date()
+        if today != self.day:
+            self.day = today
+            self.tokens = float(self.capacity)
+
+    def wait_time(self, reserve=0):
+        """
+        Parameters:
+        - reserve (float): Share of the capacity that must stay available after the token is taken
+
+        Returns:
+        - float: Seconds until one token is available, 0 if one is available now
+        """
+        self.refill()
+        if self.tokens >= 1 + reserve * self.capacity:
+            return 0
+        # Nothing comes back before the quota resets at midnight
+        midnight = datetime.combine(self.day + timedelta(days=1), datetime.min.time(), timezone.utc)
+        return max((midnight - datetime.now(timezone.utc)).total_seconds(), 1)
+
+    def fill_ratio(self):
+        """
+        Returns:
+        - float: Share of the quota still available, between 0 and 1
+        """
+        self.refill()
+        return self.tokens / self.capacity
+
+
+class QuotaGovernor:
+    def __init__(self, plan=API_PLAN):
+        """
+        Holds every API-Football request to the per-minute and per-day budget of a plan.
+
+        Parameters:
+        - plan (str): Plan name from API_PLAN_LIMITS, e.g. "free" or "pro"
+        """
+        if plan not in API_PLAN_LIMITS:
+            logging.warning(f"Unknown API plan '{plan}', using the free plan limits.")
+            plan = "free"
+
+        self.plan = plan
+        per_minute, per_day = API_PLAN_LIMITS[plan]
+
+        self.minute_bucket = TokenBucket(per_minute, 60)
+        self.day_bucket = DailyQuota(per_day)
+
+        # Shared by the bot loop and the setup scripts running in other threads
+        self.lock = threading.Lock()
+        # Requests of the live polls waiting for a token, background requests go after them
+        self.waiting = 0
+
+    def try_acquire(self, reserve=0):
+        """
+        Takes one token from both buckets if both have one.
+
+        Parameters:
+        - reserve (float): Share of both buckets that must stay available, see BACKGROUND_RESERVE
+
+        Returns:
+        - float: 0 if the request may go ahead, otherwise seconds to wait before retrying
+        """
+        with self.lock:
+            wait = max(self.minute_bucket.wait_time(reserve), self.day_bucket.wait_time(reserve))
+            if wait == 0:
+                self.minute_bucket.tokens -= 1
+                self.day_bucket.tokens -= 1
+            return wait
+
+    async def acquire(self, background=False):
+        """
+        Waits without blocking the event loop until a request fits in the budget.
+
+        Parameters:
+        - background (bool): Low priority request, e.g. an index refresh. It waits while
+          live polls are queued and only uses the budget above BACKGROUND_RESERVE.
+        """
+        if background:
+            while True:
+                wait = BACKGROUND_RETRY if self.waiting else self.try_acquire(BACKGROUND_RESERVE)
+                if wait == 0:
+                    return
+                await asyncio.sleep(wait)
+
+        self.waiting += 1
+        try:
+            while True:
+                wait = self.try_acquire()
+                if wait == 0:
+                    return
+                await asyncio.sleep(wait)
+        finally:
+            self.waiting -= 1
+
+    def acquire_blocking(self):
+        """Blocks the calling thread until a request fits in the budget."""
+        while True:
+            wait = self.try_acquire()
+            if wait == 0:
+                return
+            time.sleep(wait)
+
+    def sync_from_headers(self, response_headers):
+        """
+        Aligns the budget with the remaining quota reported by API-Football.
+
+        The minute bucket is only lowered, as responses of concurrent requests come back
+        out of order. The daily count is taken as is, so a reset the API did at midnight
+        is picked up as soon as one response reports it.
+
+        Parameters:
+        - response_headers (Mapping): Headers of an API-Football response
+        """
+        with self.lock:
+            remaining = response_headers.get("X-RateLimit-Remaining")
+            if remaining is not None and str(remaining).isdigit():
+                self.minute_bucket.refill()
+                self.minute_bucket.tokens = min(self.minute_bucket.tokens, float(remaining))
+
+            remaining = response_headers.get("x-ratelimit-requests-remaining")
+            if remaining is not None and str(remaining).isdigit():
+                self.day_bucket.refill()
+                self.day_bucket.tokens = min(float(remaining), self.day_bucket.capacity)
+
+    def day_left(self):
+        """
+        Returns:
+        - float: Share of the daily budget still available, between 0 and 1
+        """
+        with self.lock:
+            return self.day_bucket.fill_ratio()
+
+    def exhaust_minute(self):
+        """Empties the per-minute bucket after the API answered 429 Too Many Requests."""
+        with self.lock:
+            self.minute_bucket.refill()
+            self.minute_bucket.tokens = 0
+
+    def throttle(self, interval):
+        """
+        Stretches a polling interval as the budget runs low.
+
+        Parameters:
+        - interval (int): Seconds the caller would normally wait
+
+        Returns:
+        - int: Seconds to wait, never shorter than interval
+        """
+        with self.lock:
+            minute_left = self.minute_bucket.fill_ratio()
+            day_left = self.day_bucket.fill_ratio()
+
+        multiplier = 1
+        if day_left < 0.1:
+            multiplier = 4
+        elif day_left < 0.25 or minute_left < 0.2:
+            multiplier = 2
+
+        return interval * multiplier
+
+
+# Shared governor for every API-Football call made by this process
+quota_governor = QuotaGovernor()
@@ -0,0 +1,181 @@
+import gzip
+import json
+import queue
+import threading
+import time
+
+from .time_logging import configure_logging
+from configs.config import LIVE_JSON_PATH
+
+# A full snapshot is written every this many records, so reads never replay a whole match of deltas
+KEYFRAME_INTERVAL = 30
+
+FINISHED_STATUSES = ("FT", "AET", "PEN", "ABD")
+
+
+def get_log_path(fixture_id):
+    return LIVE_JSON_PATH / f"{fixture_id}.jsonl.gz"
+
+
+def diff_fixture(previous, current):
+    """
+    Keeps the top level parts of a fixture that changed, e.g. "events" or "statistics".
+
+    Parameters:
+    - previous (dict): Fixture from the last record, i.e. response[0]
+    - current (dict): Fixture from this poll
+
+    Returns:
+    - dict: {key: new value}, a removed key maps to None
+    """
+    delta = {key: value for key, value in current.items() if previous.get(key) != value}
+    for key in previous:
+        if key not in current:
+            delta[key] = None
+    return delta
+
+
+class SnapshotLog:
+    def __init__(self):
+        """
+        Per-fixture append-only log of every polled snapshot.
+
+        Each record is one gzip member holding a JSON line: a full fixture every
+        KEYFRAME_INTERVAL records and only the changed parts in between.
+        Records are written by a background thread so polls never wait on the disk.
+        """
+        self.queue = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+        # Only touched by the writer thread
+        # {fixture_id: (last fixture written, records since the last keyframe)}
+        self.previous = {}
+
+        self.logger = configure_logging("snapshot_log", "system")
+
+    def append(self, specific_fixture):
+        """
+        Queues a snapshot to be written, returning immediately.
+
+        Parameters:
+        - specific_fixture (dict): Raw fixture API response holding a single fixture
+        """
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._write_loop, name="snapshot_log", daemon=True)
+                self.thread.start()
+
+        self.queue.put((time.time(), specific_fixture["response"][0]))
+
+    def close(self):
+        """Writes everything still queued and stops the writer."""
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                return
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+    def _write_loop(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+
+            try:
+                self._write(*item)
+            except Exception as e:
+                # A failed write must not stop the records of every other fixture
+                self.logger.error(f"Failed to write snapshot: {e}")
+
+    def _write(self, polled_at, fixture):
+        fixture_id = fixture["fixture"]["id"]
+        status = fixture["fixture"]["status"]
+
+        record = {
+            "t": polled_at,
+            "status": status["short"],
+            "elapsed": status["elapsed"],
+        }
+
+        previous = self.previous.get(fixture_id)
+        if previous is None or previous[1] >= KEYFRAME_INTERVAL:
+            record["full"] = fixture
+            count = 1
+        else:
+            delta = diff_fixture(previous[0], fixture)
+            if not delta:
+                # Same snapshot polled again, nothing new to keep
+                return
+            record["delta"] = delta
+            count = previous[1] + 1
+
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+        # Concatenated gzip members read back as one stream
+        with open(get_log_path(fixture_id), "ab") as f:
+            f.write(gzip.compress(line.encode("utf-8")))
+
+        if status["short"] in FINISHED_STATUSES:
+            self.previous.pop(fixture_id, None)
+        else:
+            self.previous[fixture_id] = (fixture, count)
+
+
+def read_snapshots(fixture_id):
+    """
+    Replays the log of a fixture.
+
+    Parameters:
+    - fixture_id (int): The unique identifier for the fixture
+
+    Yields:
+    - tuple: (record, fixture) with the record metadata ("t", "status", "elapsed")
+      and the fixture rebuilt as it was at that poll
+    """
+    fixture = None
+
+    with gzip.open(get_log_path(fixture_id), "rt", encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+
+            if "full" in record:
+                fixture = record.pop("full")
+            else:
+                fixture = dict(fixture)
+                for key, value in record.pop("delta").items():
+                    if value is None:
+                        fixture.pop(key, None)
+                    else:
+                        fixture[key] = value
+
+            yield record, fixture
+
+
+def get_state_at(fixture_id, minute):
+    """
+    Rebuilds a fixture as it was at a given minute of the match.
+
+    Parameters:
+    - fixture_id (int): The unique identifier for the fixture
+    - minute (int): Minute of the match, e.g. 45
+
+    Returns:
+    - dict: Fixture response in the /fixtures?id= shape, from the last poll at or before that minute.
+      None if nothing was logged that early.
+    """
+    state = None
+    for record, fixture in read_snapshots(fixture_id):
+        elapsed = record["elapsed"]
+        if elapsed is not None and elapsed > minute:
+            break
+        state = fixture
+
+    if state is None:
+        return None
+    return {"response": [state]}
+
+
+# Shared log written by every poll in the bot process
+snapshot_log = SnapshotLog()
@@ -43,6 +43,16 @@ IMPORTANT_LEAGUES = [int(id.strip()) for id in important_leagues_str.split(',')]
 # Ultra: 450 req/min (75,000/day)
 # Mega: 900 req/min (150,000/day)
 # Custom: 1200 req/min (1.5M/day)
+API_PLAN_LIMITS = {
+    "free": (10, 100),
+    "pro": (300, 7500),
+    "ultra": (450, 75000),
+    "mega": (900, 150000),
+    "custom": (1200, 1500000),
+}
+
+# Plan whose limits every API call is held to: free, pro, ultra, mega or custom
+API_PLAN = os.getenv('API_PLAN', 'free').strip().lower()
 
 # Note: This project uses api-football.com but is not endorsed by or affiliated with them.
 # It was chosen purely based on feature set and reliability at time of development.
@@ -52,6 +62,32 @@ IMPORTANT_LEAGUES = [int(id.strip()) for id in important_leagues_str.split(',')]
 # Other tiers: 45 seconds is optimal
 LOOP_WAIT_TIME = int(os.getenv('LOOP_WAIT_TIME', '120'))
 
+# Async API client settings
+# Seconds before a single API request is abandoned
+API_TIMEOUT = int(os.getenv('API_TIMEOUT', '10'))
+# Maximum number of API requests in flight at once
+API_MAX_CONCURRENCY = int(os.getenv('API_MAX_CONCURRENCY', '5'))
+# Seconds a fetched fixture is reused by lookups such as /follow and /next_game
+# Keep it below LOOP_WAIT_TIME so live polls always get fresh data
+FIXTURE_CACHE_TTL = int(os.getenv('FIXTURE_CACHE_TTL', '30'))
+# Seconds before kickoff when followed games start being polled
+# Until then the kickoff time from the local fixture index is enough
+PRE_GAME_WINDOW = int(os.getenv('PRE_GAME_WINDOW', '600'))
+# Worker processes for CPU heavy work such as building banners
+CPU_WORKERS = int(os.getenv('CPU_WORKERS', '2'))
+# Size cap of the GameBanners directory, least recently used banners are deleted past it
+BANNER_STORE_MAX_MB = int(os.getenv('BANNER_STORE_MAX_MB', '200'))
+# Seconds between live refreshes of the fixture and team index
+# Free tier: twice a day, a refresh costs about 5 of the 100 daily requests
+INDEX_REFRESH_INTERVAL = int(os.getenv('INDEX_REFRESH_INTERVAL', '43200' if API_PLAN == 'free' else '3600'))
+# Age in seconds after which a league's fixtures and standings are downloaded again in full
+# Free tier: once a week, every league costs 2 requests
+LEAGUE_DATA_TTL = int(os.getenv('LEAGUE_DATA_TTL', '604800' if API_PLAN == 'free' else '86400'))
+# Share of the daily API budget that must be left for the index refresh to run
+INDEX_REFRESH_MIN_BUDGET = float(os.getenv('INDEX_REFRESH_MIN_BUDGET', '0.6'))
+# Image format of the banners, png or webp
+BANNER_FORMAT = os.getenv('BANNER_FORMAT', 'png').lower()
+
 from pathlib import Path
 
 def get_executable_dir():
@@ -66,21 +102,19 @@ def get_executable_dir():
 
 # Project structure
 
-print("Path: ", get_executable_dir())
-
 PROJECT_ROOT = Path(get_executable_dir())
 IMAGES_HELPER_PATH = PROJECT_ROOT / "images_helper_files"
 LOGGING_PATH = IMAGES_HELPER_PATH / "Logging"
 FIXTURES_PATH = IMAGES_HELPER_PATH / "AllFixtures"
 STANDINGS_PATH = IMAGES_HELPER_PATH / "AllStandings"
 BANNERS_PATH = IMAGES_HELPER_PATH / "GameBanners"
+LOGOS_PATH = IMAGES_HELPER_PATH / "TeamLogos"
 LEAGUE_STATUS = IMAGES_HELPER_PATH / "League_Status"
 
 VS_PATH = PROJECT_ROOT / "assets" / "images" / "vs.png"
-FIXTURES_BY_LEAGUE_PATH = IMAGES_HELPER_PATH / "fixtures_by_league.json"
-INFORMATION_PATH = IMAGES_HELPER_PATH / "information.json"
-TEAMS_PATH = IMAGES_HELPER_PATH / "teams.json"
+FIXTURE_STORE_PATH = IMAGES_HELPER_PATH / "fixtures.db"
 LIVE_JSON_PATH = IMAGES_HELPER_PATH / "LiveJson"
+FOLLOW_JOURNAL_PATH = IMAGES_HELPER_PATH / "follows.jsonl"
 LEAGUES_JSON_PATH = PROJECT_ROOT / "assets" / "leagues_available.json"
 
 
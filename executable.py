@@ -7,6 +7,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 import subprocess
+import multiprocessing
 from pathlib import Path
 import asyncio
 import logging
@@ -26,6 +27,7 @@ WEBSITE_NAME="BernKing Blog"
 WEBSITE_URL=https://bernking.xyz/
 MAX_SIMULTANEOUS_GAMES=3
 LOOP_WAIT_TIME=120
+API_PLAN=free
 IMPORTANT_LEAGUES=5"""
     
     try:
@@ -99,6 +101,18 @@ class BotThread(QThread):
                 self.loop.stop()
                 self.loop.close()
 
+class PrerenderThread(QThread):
+    log_signal = pyqtSignal(str)
+
+    def run(self):
+        # Off the GUI thread, building a week of banners takes a while
+        try:
+            from scripts.prerender_banners import run_prerender
+            run_prerender()
+            self.log_signal.emit("✅ Match banners built!")
+        except Exception as e:
+            self.log_signal.emit(f"❌ Failed to build match banners: {str(e)}")
+
 class LogCapture:
     def __init__(self, signal):
         self.signal = signal
@@ -128,6 +142,7 @@ class SetupWindow(QMainWindow):
         self.init_bot_tab()
         
         self.bot_thread = None
+        self.prerender_thread = None
         self.load_env_vars()
         
         self.has_unsaved_changes = False
@@ -157,7 +172,8 @@ class SetupWindow(QMainWindow):
             'WEBSITE_NAME': 'Website Name',
             'WEBSITE_URL': 'Website URL',
             'MAX_SIMULTANEOUS_GAMES': 'Max Simultaneous Games (default: 3)',
-            'LOOP_WAIT_TIME': 'Loop Wait Time (default: 120)'
+            'LOOP_WAIT_TIME': 'Loop Wait Time (default: 120)',
+            'API_PLAN': 'API Plan (free, pro, ultra, mega, custom)'
         }
         
         for var, desc in env_vars.items():
@@ -352,6 +368,7 @@ class SetupWindow(QMainWindow):
                 get_league_standings,
                 get_fixtures_file
             )
+            from common_utils.fixture_store import fixture_store
             
             # Get selected leagues from checkboxes
             important_leagues = [
@@ -364,8 +381,15 @@ class SetupWindow(QMainWindow):
             stats_availables = parse_status_fixtures_available()
             get_league_standings(stats_availables, important_leagues)
             get_fixtures_file(stats_availables, important_leagues)
+            fixture_store.sync()
             
             self.status_text.append("✅ League status checked successfully!")
+
+            if not self.prerender_thread or not self.prerender_thread.isRunning():
+                self.status_text.append("Building match banners in the background...")
+                self.prerender_thread = PrerenderThread()
+                self.prerender_thread.log_signal.connect(self.status_text.append)
+                self.prerender_thread.start()
         except Exception as e:
             self.status_text.append(f"❌ Failed to check league status: {str(e)}")
 
@@ -377,6 +401,7 @@ class SetupWindow(QMainWindow):
         required_dirs = [
             'images_helper_files',
             'images_helper_files/GameBanners',
+            'images_helper_files/TeamLogos',
             'images_helper_files/AllFixtures',
             'images_helper_files/AllStandings',
             'images_helper_files/League_Status',
@@ -406,6 +431,7 @@ class SetupWindow(QMainWindow):
         required_dirs = [
             'images_helper_files',
             'images_helper_files/GameBanners',
+            'images_helper_files/TeamLogos',
             'images_helper_files/AllFixtures',
             'images_helper_files/AllStandings',
             'images_helper_files/League_Status',
@@ -608,6 +634,8 @@ class SetupWindow(QMainWindow):
                 self.save_env()
 
 if __name__ == "__main__":
+    # Worker processes of the frozen app start from this executable too
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = SetupWindow()
     window.show()
@@ -18,7 +18,6 @@ a = Analysis(
         'json',
         'logging',
         'pathlib',
-        'pandas',
     ],
     hookspath=[],
     hooksconfig={},
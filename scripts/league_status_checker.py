@@ -7,6 +7,9 @@ import json
 from time import sleep, time
 from configs.config import base_url, headers, IMPORTANT_LEAGUES, LEAGUE_STATUS, FIXTURES_PATH, STANDINGS_PATH
 from scripts.setup_directories import get_executable_dir
+from common_utils.quota_governor import quota_governor
+from scripts.prerender_banners import run_prerender
+from common_utils.fixture_store import fixture_store
 
 def get_league_status(temp_dir=None):
     """
@@ -23,7 +26,9 @@ def get_league_status(temp_dir=None):
     """
     params = {'season': 2024, 'current': "true"}
     fixtures_url = base_url + "/leagues"
+    quota_governor.acquire_blocking()
     response = requests.get(fixtures_url, headers=headers, params=params)
+    quota_governor.sync_from_headers(response.headers)
 
     if response.status_code == 200:
         data = response.json()
@@ -88,7 +93,9 @@ def get_fixtures_file(stats_availables, important_league):
 
         params = {'league': league_id, 'season': 2024, 'timezone' : "Europe/London"}
         fixtures_url = base_url + "/fixtures"
+        quota_governor.acquire_blocking()
         response = requests.get(fixtures_url, headers=headers, params=params)
+        quota_governor.sync_from_headers(response.headers)
 
         if response.status_code == 200:
             data = response.json()
@@ -121,7 +128,9 @@ def get_league_standings(stats_availables, important_league):
              
         params = {'league': league_id, 'season': 2024}
         standings_url = base_url + "/standings"
+        quota_governor.acquire_blocking()
         response = requests.get(standings_url, headers=headers, params=params)
+        quota_governor.sync_from_headers(response.headers)
 
         if response.status_code == 200:
             data = response.json()
@@ -149,3 +158,9 @@ if __name__ == "__main__":
     get_fixtures_file(stats_availables, important_league)
     get_league_standings(stats_availables, important_league)
     print("\nAll data fetched successfully.")
+
+    # Import the downloads so the bot starts without parsing them
+    fixture_store.sync()
+
+    # Build the banners now so the first /follow of each game doesn't wait for them
+    run_prerender()
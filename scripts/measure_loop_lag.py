@@ -0,0 +1,136 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import asyncio
+import json
+import statistics
+import tempfile
+
+import discord
+from PIL import Image
+
+from configs.config import VS_PATH, BANNER_FORMAT
+from common_utils.banner_formatter import combine_images, VS_IMAGE_PATH
+from common_utils.asset_cache import BANNER_ATTACHMENT
+from common_utils.time_logging import configure_logging
+from common_utils.executor import executor
+
+# How often the probe wakes up to check how late the loop is
+PROBE_INTERVAL = 0.005
+# Number of simulated polls in each run
+ROUNDS = 20
+
+
+def make_logos(work_dir, name):
+    """
+    Writes a pair of local team logos, so the banners are built without downloads.
+
+    Every run gets its own files, so the logo cache of combine_images starts cold
+    in both runs, as for the first game of a team.
+
+    Parameters:
+    - work_dir (Path): Scratch directory
+    - name (str): Prefix of the file names
+
+    Returns:
+    - tuple: File paths of the home and away logos
+    """
+    logo = Image.open(VS_PATH).convert("RGBA").resize((512, 512))
+    paths = (str(work_dir / f"{name}_home.png"), str(work_dir / f"{name}_away.png"))
+    for path in paths:
+        logo.save(path)
+    return paths
+
+
+def dump_fixture(fixture, output_path):
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(fixture, f, ensure_ascii=False, indent=4)
+
+
+def fake_fixture():
+    """Builds a fixture response about as large as a live one."""
+    events = [
+        {"time": {"elapsed": minute, "extra": None}, "team": {"id": 1, "name": "Home"},
+         "player": {"id": minute, "name": f"Player {minute}"}, "type": "Card", "detail": "Yellow Card", "comments": None}
+        for minute in range(0, 90, 5)
+    ]
+    statistics = [
+        {"team": {"id": team_id}, "statistics": [{"type": f"Stat {index}", "value": index} for index in range(18)]}
+        for team_id in (1, 2)
+    ]
+    return {"response": [{"fixture": {"id": 1}, "events": events, "statistics": statistics}] * 20}
+
+
+async def probe(lags, stop):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(loop.time() - started - PROBE_INTERVAL)
+
+
+async def run(offloaded, work_dir, logos):
+    """
+    Runs one poll worth of blocking steps per round while the probe measures loop lag.
+
+    Parameters:
+    - offloaded (bool): Whether the steps go through the executor
+    - work_dir (Path): Scratch directory for the files written
+    - logos (tuple): Home and away logo paths, see make_logos
+
+    Returns:
+    - list: Lag of every probe wake up, in seconds
+    """
+    lags = []
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(lags, stop))
+    fixture = fake_fixture()
+
+    for round_number in range(ROUNDS):
+        banner_path = str(work_dir / f"banner{round_number}.{BANNER_FORMAT}")
+        json_path = str(work_dir / f"fixture{round_number}.json")
+
+        if offloaded:
+            await executor.run_cpu(combine_images, logos[0], VS_IMAGE_PATH, logos[1], banner_path)
+            await executor.run_io(dump_fixture, fixture, json_path)
+            file = await executor.run_io(discord.File, banner_path, filename=BANNER_ATTACHMENT)
+            await executor.run_io(configure_logging, "lag_probe", "system")
+        else:
+            combine_images(logos[0], VS_IMAGE_PATH, logos[1], banner_path)
+            dump_fixture(fixture, json_path)
+            file = discord.File(banner_path, filename=BANNER_ATTACHMENT)
+            configure_logging("lag_probe", "system")
+
+        file.close()
+        # Let the probe run between polls
+        await asyncio.sleep(0.02)
+
+    stop.set()
+    await probe_task
+    return lags
+
+
+def report(name, lags):
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p99 = lags_ms[int(len(lags_ms) * 0.99) - 1]
+    print(f"{name:<12} mean {statistics.mean(lags_ms):7.2f} ms   p99 {p99:7.2f} ms   max {lags_ms[-1]:7.2f} ms")
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = Path(temp_dir)
+
+        # Start the workers first so their startup isn't counted
+        home_logo, away_logo = make_logos(work_dir, "warmup")
+        await executor.run_cpu(combine_images, home_logo, VS_IMAGE_PATH, away_logo, str(work_dir / f"warmup.{BANNER_FORMAT}"))
+
+        report("inline", await run(False, work_dir, make_logos(work_dir, "inline")))
+        report("offloaded", await run(True, work_dir, make_logos(work_dir, "offloaded")))
+
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    print(f"Event loop lag over {ROUNDS} simulated polls, probe every {PROBE_INTERVAL * 1000:.0f} ms")
+    asyncio.run(main())
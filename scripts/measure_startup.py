@@ -0,0 +1,101 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import os
+import statistics
+import subprocess
+
+PROJECT_ROOT = Path(__file__).parent.parent
+# Fresh interpreters started for the cold start timings
+RUNS = 5
+# Modules listed in the import profile
+TOP_IMPORTS = 20
+
+# Runs in the child interpreter, prints the seconds until bot.main is imported and until the team index is ready
+STARTUP_PROBE = """
+import time
+started = time.perf_counter()
+import bot.main
+imported = time.perf_counter()
+bot.main.teams_organizer_ready.result()
+ready = time.perf_counter()
+print(imported - started, ready - started)
+bot.main.executor.shutdown()
+"""
+
+
+def run_python(args):
+    """
+    Runs a fresh interpreter with the import paths the bot runs with.
+
+    Parameters:
+    - args (list): Interpreter arguments
+
+    Returns:
+    - subprocess.CompletedProcess: Finished process, its output captured
+    """
+    # The project root for bot.*, common_utils.* and configs.*, bot/ for services.* and views.*, as in executable.py
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(PROJECT_ROOT), str(PROJECT_ROOT / "bot")]))
+    result = subprocess.run([sys.executable, *args], cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Python exited with {result.returncode}:\n{result.stderr}")
+    return result
+
+
+def profile_imports(module="bot.main", top=TOP_IMPORTS):
+    """
+    Prints the slowest imports of a module, from python -X importtime.
+
+    Parameters:
+    - module (str): Module to import
+    - top (int): Number of modules listed
+
+    Returns:
+    - float: Cumulative import time of the module in milliseconds
+    """
+    result = run_python(["-X", "importtime", "-c", f"import {module}"])
+
+    # Lines look like "import time:       569 |     867714 |   bot.main"
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings.append((int(cumulative_us), int(self_us), name.rstrip()))
+
+    print(f"\nSlowest imports of {module} (cumulative ms / self ms):")
+    for cumulative_us, self_us, name in sorted(timings, reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:9.1f} {self_us / 1000:9.1f}  {name}")
+
+    total = next((cumulative_us for cumulative_us, _, name in timings if name.strip() == module), 0)
+    return total / 1000
+
+
+def measure_cold_start(runs=RUNS):
+    """
+    Starts fresh interpreters and times the bot startup stages.
+
+    Parameters:
+    - runs (int): Number of interpreters started
+
+    Returns:
+    - tuple: Median milliseconds until bot.main is imported and the bot can connect,
+      and until the team index is ready
+    """
+    imported, ready = [], []
+    for _ in range(runs):
+        result = run_python(["-c", STARTUP_PROBE])
+        import_seconds, ready_seconds = map(float, result.stdout.split()[-2:])
+        imported.append(import_seconds * 1000)
+        ready.append(ready_seconds * 1000)
+    return statistics.median(imported), statistics.median(ready)
+
+
+if __name__ == "__main__":
+    profile_imports()
+
+    imported, ready = measure_cold_start()
+    print(f"\nMedian of {RUNS} cold starts:")
+    print(f"bot.main imported, gateway connect can start: {imported:7.1f} ms")
+    print(f"Team index ready:                             {ready:7.1f} ms")
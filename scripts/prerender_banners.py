@@ -0,0 +1,119 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import asyncio
+import json
+import os
+from datetime import datetime, timezone, timedelta
+
+from configs.config import FIXTURES_PATH
+from common_utils.asset_cache import AssetCache
+from common_utils.executor import Executor
+
+# Banners are built for the games of the next week
+PRERENDER_DAYS = 7
+# Logo downloads running at once
+MAX_LOGO_DOWNLOADS = 8
+
+
+def get_upcoming_fixtures(asset_cache, days=PRERENDER_DAYS):
+    """
+    Reads the downloaded fixture files for the games kicking off soon.
+
+    Parameters:
+    - asset_cache (AssetCache): Cache naming the banner files
+    - days (int): How far ahead to look
+
+    Returns:
+    - list: Fixture responses holding a single fixture each, one per banner, soonest last
+    """
+    now = datetime.now(timezone.utc)
+    horizon = now + timedelta(days=days)
+
+    upcoming = {}
+    for filename in os.listdir(FIXTURES_PATH):
+        with open(os.path.join(FIXTURES_PATH, filename), 'r', encoding='utf-8') as league_fixtures_file:
+            fixtures = json.load(league_fixtures_file)
+
+        for fixture in fixtures.get("response", []):
+            date = datetime.fromisoformat(fixture["fixture"]["date"])
+            # Games that kicked off in the last 4 hours can still be followed
+            if not now - timedelta(hours=4) <= date <= horizon:
+                continue
+
+            specific_fixture = {"response": [fixture]}
+            upcoming.setdefault(asset_cache.get_banner_path(specific_fixture), (date, specific_fixture))
+
+    # Built furthest first, so if the store cap is hit the soonest games keep their banners
+    return [specific_fixture for _, specific_fixture in sorted(upcoming.values(), key=lambda item: item[0], reverse=True)]
+
+
+async def prerender_banners(asset_cache, days=PRERENDER_DAYS, max_downloads=MAX_LOGO_DOWNLOADS):
+    """
+    Builds the missing banners of the upcoming games, so /follow finds them on disk.
+
+    Logos are downloaded with bounded concurrency first, then the banners are
+    composed in the worker process pool.
+
+    Parameters:
+    - asset_cache (AssetCache): Cache downloading the logos and building the banners
+    - days (int): How far ahead to look
+    - max_downloads (int): Logo downloads running at once
+    """
+    missing = [
+        specific_fixture for specific_fixture in get_upcoming_fixtures(asset_cache, days)
+        if not os.path.exists(asset_cache.get_banner_path(specific_fixture))
+    ]
+    print(f"\n{len(missing)} banners to build for the next {days} days.")
+    if not missing:
+        return
+
+    teams = {}
+    for specific_fixture in missing:
+        for side in ("home", "away"):
+            team = specific_fixture["response"][0]["teams"][side]
+            teams[team["id"]] = team["logo"]
+
+    print(f"Fetching logos of {len(teams)} teams...")
+    await asset_cache.prefetch_logos(list(teams.items()), max_concurrency=max_downloads)
+
+    results = await asyncio.gather(
+        *(asset_cache.get_banner(specific_fixture) for specific_fixture in missing),
+        return_exceptions=True,
+    )
+
+    failed = [result for result in results if isinstance(result, Exception)]
+    for error in failed:
+        print(f"Error building banner: {error}")
+    print(f"Built {len(results) - len(failed)} banners.")
+
+
+def run_prerender(days=PRERENDER_DAYS):
+    """
+    Runs the pre-render stage from synchronous setup code.
+
+    The GUI runs it in the process the bot runs in, so it uses its own session and
+    worker pools and closes only those, never the shared asset_cache and executor.
+
+    Parameters:
+    - days (int): How far ahead to look
+    """
+    prerender_executor = Executor()
+    prerender_cache = AssetCache(executor=prerender_executor)
+
+    async def run():
+        try:
+            await prerender_banners(prerender_cache, days)
+        finally:
+            await prerender_cache.close()
+
+    try:
+        asyncio.run(run())
+    finally:
+        prerender_executor.shutdown()
+
+
+if __name__ == "__main__":
+    print(f"Fixtures: {FIXTURES_PATH.absolute()}")
+    run_prerender()
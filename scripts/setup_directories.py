@@ -23,6 +23,7 @@ def create_directories():
     directories = [
         'images_helper_files',
         'images_helper_files/GameBanners',
+        'images_helper_files/TeamLogos',
         'images_helper_files/AllFixtures',
         'images_helper_files/AllStandings',
         'images_helper_files/League_Status',
@@ -0,0 +1,109 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from bot.services.snapshot_diff import (
+    diff_snapshots,
+    get_new_events,
+    event_key,
+    EVENT_ADDED,
+    EVENT_REMOVED,
+    EVENT_AMENDED,
+)
+
+
+def make_event(event_type, detail, minute, player_id, team_id=1, player_name="Player"):
+    return {
+        "time": {"elapsed": minute, "extra": None},
+        "team": {"id": team_id, "name": "Home"},
+        "player": {"id": player_id, "name": player_name},
+        "type": event_type,
+        "detail": detail,
+        "comments": None,
+    }
+
+
+def make_fixture(events):
+    return {"response": [{
+        "fixture": {"status": {"short": "2H", "elapsed": 70}},
+        "teams": {"home": {"id": 1}, "away": {"id": 2}},
+        "goals": {"home": 0, "away": 0},
+        "events": events,
+        "statistics": [],
+    }]}
+
+
+def event_changes(previous, current, kind):
+    return [change for change in diff_snapshots(previous, current) if change.kind == kind]
+
+
+def test_late_yellow_card_does_not_reannounce_red_card():
+    red_card = make_event("Card", "Red Card", 60, 9)
+    yellow_card = make_event("Card", "Yellow Card", 30, 4)
+    previous = make_fixture([red_card])
+    current = make_fixture([yellow_card, red_card])
+
+    added = event_changes(previous, current, EVENT_ADDED)
+    assert [change.after for change in added] == [yellow_card]
+    assert not event_changes(previous, current, EVENT_REMOVED)
+
+    announced = [event_key(red_card)]
+    assert get_new_events(current["response"][0]["events"], announced) == [yellow_card]
+
+
+def test_late_goal_does_not_reannounce_later_goal():
+    later_goal = make_event("Goal", "Normal Goal", 60, 9)
+    earlier_goal = make_event("Goal", "Normal Goal", 30, 4)
+    previous = make_fixture([later_goal])
+    current = make_fixture([earlier_goal, later_goal])
+
+    assert [change.after for change in event_changes(previous, current, EVENT_ADDED)] == [earlier_goal]
+    assert get_new_events(current["response"][0]["events"], [event_key(later_goal)]) == [earlier_goal]
+
+
+def test_corrected_player_and_minute_is_amended():
+    goal = make_event("Goal", "Normal Goal", 12, None, player_name="Scorer")
+    corrected = make_event("Goal", "Normal Goal", 13, 77, player_name="Scorer")
+    previous = make_fixture([goal])
+    current = make_fixture([corrected])
+
+    amended = event_changes(previous, current, EVENT_AMENDED)
+    assert [(change.before, change.after) for change in amended] == [(goal, corrected)]
+    assert not event_changes(previous, current, EVENT_ADDED)
+    assert not event_changes(previous, current, EVENT_REMOVED)
+
+    # The same correction made while the bot was down
+    assert get_new_events([corrected], [event_key(goal)]) == []
+
+
+def test_same_player_correction_pairs_with_nearest_minute():
+    first = make_event("Goal", "Normal Goal", 20, 9)
+    second = make_event("Goal", "Normal Goal", 70, 9)
+    corrected_second = make_event("Goal", "Normal Goal", 68, 9)
+    previous = make_fixture([first, second])
+    current = make_fixture([first, corrected_second])
+
+    amended = event_changes(previous, current, EVENT_AMENDED)
+    assert [(change.before, change.after) for change in amended] == [(second, corrected_second)]
+
+
+def test_far_apart_goals_of_different_players_are_not_paired():
+    cancelled = make_event("Goal", "Normal Goal", 20, 9)
+    new_goal = make_event("Goal", "Normal Goal", 80, 4)
+    previous = make_fixture([cancelled])
+    current = make_fixture([new_goal])
+
+    assert [change.after for change in event_changes(previous, current, EVENT_ADDED)] == [new_goal]
+    assert [change.before for change in event_changes(previous, current, EVENT_REMOVED)] == [cancelled]
+
+
+def test_identical_events_are_announced_once():
+    event = make_event("Var", "Goal cancelled", 40, None, player_name=None)
+    events = [event, dict(event)]
+
+    assert get_new_events(events, []) == events
+    assert get_new_events(events, [event_key(event) for event in events]) == []
+
+
+def test_unknown_cursor_announces_nothing():
+    assert get_new_events([make_event("Goal", "Normal Goal", 10, 9)], None) == []